@@ -0,0 +1,6 @@
+# __init__.py - Trading strategy package
+#
+# The strategy modules share private helpers (_njit, _regime_tables, _kernels,
+# _timefmt) through relative imports, so they must be imported through the
+# package - `from strategies.aggressive_v1 import AggressiveBot` - rather than
+# as top-level modules with strategies/ itself on sys.path.
@@ -0,0 +1,83 @@
+# _kernels.py - Ahead-of-time build of the simulate() kernels
+#
+# Run `python -m strategies._kernels` once (requires numba) to compile the
+# ConservativeBot and FlipBotV2 simulate() loops into the extension module
+# strategies/_kernels_aot. The strategy modules pick it up through load_aot()
+# - no JIT warm-up in fresh processes, and it runs without numba installed -
+# and fall back to the @njit kernels when it is missing or was built from
+# different source (the build embeds a hash of the kernel modules).
+import hashlib
+import os
+import warnings
+
+# Exported name -> (module, kernel, signature). Argument types must match
+# what simulate() passes; params tuples are built with explicit casts.
+_EXPORTS = {
+    'simulate_conservative': (
+        'conservative_v1', '_simulate_conservative',
+        'Tuple((f8, f8, f8, i8, i8, f8[:, :]))'
+        '(f8, f8, f8, f8, i8, i8, b1[:], f8[:], f8[:], f8[:], i1[:], b1[:], f8[:], f8[:, :], i8[:],'
+        ' Tuple((f8, f8, i8, f8, f8, f8, f8)))'
+    ),
+    'simulate_flip': (
+        'flip_v2', '_simulate_flip',
+        'Tuple((f8, f8, i8, i8, i8, i8, f8[:]))'
+        '(f8, f8, f8, i8, i8, i8, i8, b1[:], f8[:], f8[:, :], Tuple((f8, f8, i8, f8, f8)))'
+    )
+}
+
+# Modules whose source the exported kernels are compiled from
+_SOURCES = ('conservative_v1.py', 'flip_v2.py', '_regime_tables.py', '_njit.py')
+
+
+def source_hash():
+    """Hash of the kernel source files, as a signed 64-bit int"""
+    digest = hashlib.sha256()
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in _SOURCES:
+        with open(os.path.join(here, name), 'rb') as f:
+            digest.update(f.read())
+    return int.from_bytes(digest.digest()[:8], 'little', signed=True)
+
+
+def load_aot(name, fallback):
+    """Exported kernel `name` from _kernels_aot, or `fallback` if it is missing or stale"""
+    try:
+        from . import _kernels_aot
+    except ImportError:
+        return fallback
+    try:
+        current = source_hash()
+    except OSError:  # sources not shipped - the build can't be verified
+        return fallback
+    built_from = getattr(_kernels_aot, 'source_hash', None)  # absent in builds that predate the stamp
+    if built_from is None or built_from() != current:
+        warnings.warn("strategies._kernels_aot was built from different source - using the JIT kernels; "
+                      "rebuild with `python -m strategies._kernels`", RuntimeWarning, stacklevel=2)
+        return fallback
+    return getattr(_kernels_aot, name)
+
+
+def build(output_dir=None):
+    """Compile the exported kernels into the _kernels_aot extension module"""
+    from importlib import import_module
+    from numba.pycc import CC
+
+    cc = CC('_kernels_aot')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    for name, (module, kernel, signature) in _EXPORTS.items():
+        dispatcher = getattr(import_module(f'.{module}', __package__), kernel)
+        cc.export(name, signature)(dispatcher.py_func)
+    
+    # Stamp the build with the source it came from; load_aot() checks it
+    digest = source_hash()
+    
+    def built_from():
+        return digest
+    cc.export('source_hash', 'i8()')(built_from)
+    cc.compile()
+    return cc.output_dir
+
+
+if __name__ == '__main__':
+    print(f"Built _kernels_aot in {build()}")
@@ -0,0 +1,14 @@
+# _njit.py - Optional numba support (falls back to plain Python)
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional - kernels run as regular Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable with or without arguments"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -0,0 +1,92 @@
+# _regime_tables.py - Regime codes and per-strategy regime multiplier tables
+from enum import IntEnum
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for encode_regimes
+    np = None
+
+
+class Regime(IntEnum):
+    """Market regimes - member names lower-cased are the regime strings
+    
+    Callers may pass members (or their int values) as the regime field in
+    place of the strings; they are resolved once, at the metrics boundary.
+    """
+    TRENDING_BULL = 0
+    TRENDING_BEAR = 1
+    HIGH_VOLATILITY = 2
+    SIDEWAYS = 3
+    LOW_VOLATILITY = 4
+    UNKNOWN = 5
+
+
+# Plain int codes for the hot paths and kernels (numba sees int constants, not enum members)
+REGIME_BULL = int(Regime.TRENDING_BULL)
+REGIME_BEAR = int(Regime.TRENDING_BEAR)
+REGIME_HIGHVOL = int(Regime.HIGH_VOLATILITY)
+REGIME_SIDEWAYS = int(Regime.SIDEWAYS)
+REGIME_LOWVOL = int(Regime.LOW_VOLATILITY)
+REGIME_UNKNOWN = int(Regime.UNKNOWN)
+
+# Regime name, code or Regime member -> int code; anything else maps to
+# REGIME_UNKNOWN via REGIME_CODES.get(value, REGIME_UNKNOWN)
+REGIME_CODES = {regime.name.lower(): int(regime) for regime in Regime if regime is not Regime.UNKNOWN}
+REGIME_CODES.update({int(regime): int(regime) for regime in Regime})
+
+# Code -> regime name, for rebuilding trade records
+REGIME_BY_CODE = tuple(regime.name.lower() for regime in Regime)
+
+# Sorted so regime strings can be encoded with np.searchsorted
+REGIME_NAMES = tuple(sorted(name for name in REGIME_CODES if isinstance(name, str)))
+
+# Multiplier tables, one entry per regime code. Plain tuples so the scalar
+# paths work without numpy; numba freezes them as compile-time constants.
+
+# AggressiveBot: (success_adj, profit_mult, loss_adj, leverage)
+# Aggressive thrives in volatility - biggest profits there, tighter stops in trends
+AGGRESSIVE_TABLE = (
+    (1.2, 1.5, 0.8, 1.3),    # trending_bull
+    (1.15, 1.3, 0.9, 1.2),   # trending_bear
+    (1.1, 1.6, 1.4, 1.4),    # high_volatility
+    (0.9, 1.0, 1.2, 0.8),    # sideways
+    (0.85, 0.9, 0.7, 0.9),   # low_volatility
+    (1.0, 1.0, 1.0, 1.0)     # unknown
+)
+
+# ConservativeBot
+CONSERVATIVE_OK = (True, False, False, True, True, False)  # Regime preferences
+CONSERVATIVE_SUCCESS = (1.1, 0.95, 0.0, 1.0, 1.15, 0.9)   # Love low volatility, never high volatility
+CONSERVATIVE_PROFIT = (1.15, 1.05, 1.0, 1.0, 1.1, 1.0)
+CONSERVATIVE_LOSS = (0.8, 0.9, 1.0, 1.0, 0.7, 1.0)        # Tightest stops in low vol
+
+
+def encode_regimes(regime, n=None):
+    """Encode a column of regime names, codes or Regime members as an int8 code array
+    
+    A single regime is broadcast to n entries when n is given. Object
+    columns (names mixed with Regime members) are mapped element-wise
+    through REGIME_CODES.
+    """
+    values = np.asarray(regime)
+    if values.dtype.kind in 'US' and not isinstance(regime, (str, np.ndarray)):
+        # numpy stringifies mixed sequences (Regime.TRENDING_BULL becomes '0'), so keep the elements as given
+        values = np.asarray(regime, dtype=object)
+    if n is not None:
+        values = np.broadcast_to(values, (n,))
+    if values.dtype.kind in 'iu':
+        return np.where((values >= 0) & (values < REGIME_UNKNOWN), values, REGIME_UNKNOWN).astype(np.int8)
+    if values.dtype.kind == 'f':
+        # Float codes (e.g. an int column with a NaN) - integral values map like ints, as REGIME_CODES does
+        valid = np.isfinite(values) & (values == np.floor(values)) & (values >= 0) & (values < REGIME_UNKNOWN)
+        return np.where(valid, values, REGIME_UNKNOWN).astype(np.int8)
+    if values.dtype.kind == 'O':
+        codes = np.fromiter((REGIME_CODES.get(value, REGIME_UNKNOWN) for value in values.flat),
+                            dtype=np.int8, count=values.size)
+        return codes.reshape(values.shape)
+    
+    values = values.astype(str)
+    names = np.array(REGIME_NAMES)
+    codes = np.array([REGIME_CODES[name] for name in REGIME_NAMES], dtype=np.int8)
+    idx = np.minimum(np.searchsorted(names, values), len(names) - 1)
+    return np.where(names[idx] == values, codes[idx], REGIME_UNKNOWN).astype(np.int8)
@@ -0,0 +1,7 @@
+# _timefmt.py - Timestamp formatting shared by the columnar trade histories
+from datetime import datetime, timezone
+
+
+def iso_ns(ns):
+    """Format a time.time_ns() timestamp as a naive UTC ISO-8601 string"""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).replace(tzinfo=None).isoformat()
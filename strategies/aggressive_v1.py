@@ -1,154 +1,545 @@
 # aggressive.py - AI-Enhanced High Risk Mode (Tightened to 18% DD)
 import random
-import math
-from datetime import datetime
+import time
+import functools
+from array import array
+from collections import deque, namedtuple
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the batch helpers
+    np = None
+
+from ._njit import njit, prange
+from ._timefmt import iso_ns
+from ._regime_tables import (Regime, REGIME_SIDEWAYS, REGIME_LOWVOL, REGIME_UNKNOWN, REGIME_CODES,
+                             REGIME_BY_CODE, AGGRESSIVE_TABLE, encode_regimes)
+
+# Regime is re-exported so callers can build Signal tuples without reaching into _regime_tables
+__all__ = ['AggressiveBot', 'Signal', 'Regime', 'simulate_ensemble']
+
+# One bar's worth of signal fields, unpacked once from the data dict
+# (regime holds the integer code - a name, code or Regime member goes in -
+# and position_size is None when absent)
+Signal = namedtuple('Signal', 'momentum trend_strength breakout_score volatility volume_spike '
+                              'ai_confidence regime rsi confluence volume_ratio position_size')
+
+# Uniform draws generated per refill of a bot's random pool - kept small, since
+# the pool is a list of boxed floats (~32 bytes each) held by every bot
+_RAND_POOL_SIZE = 1024
+
+
+@njit(cache=True, fastmath=True)
+def _trade_core(trade_size, confidence, momentum, trend_strength, breakout_score,
+                regime_code, consecutive_wins, stop_loss, rand_exec, rand_profit):
+    """Numeric core of AggressiveBot.trade - returns (is_win, pnl, pct)
+    
+    Random draws are passed in so the kernel stays deterministic and free of
+    any RNG state.
+    """
+    success_adj, profit_mult, loss_adj, _ = AGGRESSIVE_TABLE[regime_code]
+    
+    # Aggressive success probability with hot streak bonus
+    base_success_prob = (confidence + momentum + trend_strength + breakout_score) / 4
+    streak_bonus = min(0.15, consecutive_wins * 0.03)
+    success_prob = (base_success_prob + streak_bonus) * success_adj
+    success_prob = min(0.80, max(0.25, success_prob))
+    
+    if rand_exec < success_prob:
+        base_profit_pct = 0.05 + rand_profit * 0.10  # Higher base profits
+        
+        confidence_bonus = 1 + ((confidence - 0.5) * 0.6)  # Bigger confidence bonus
+        momentum_bonus = 1 + (momentum * 0.4)             # Momentum bonus
+        hot_streak_bonus = 1 + (consecutive_wins * 0.05)  # Streak bonus
+        
+        profit_pct = (base_profit_pct * confidence_bonus * momentum_bonus *
+                      hot_streak_bonus * profit_mult)
+        profit_pct = min(0.18, profit_pct)  # Reduced cap to 18%
+        return True, trade_size * profit_pct, profit_pct
+    
+    loss_pct = min(0.06, stop_loss * loss_adj)  # Cap at 6%
+    return False, -trade_size * loss_pct, loss_pct
+
+@njit(cache=True, fastmath=True)
+def _final_size(base_size, confidence_mult, momentum_mult, hot_streak_multiplier,
+                cold_streak_mult, leverage_mult, size_reduction_factor):
+    """Sizing multiplier chain, grouped so fastmath can reassociate it into FMAs"""
+    return ((base_size * confidence_mult * momentum_mult) *
+            (hot_streak_multiplier * cold_streak_mult) *
+            (leverage_mult * size_reduction_factor))
+
+
+@njit(cache=True)
+def _position_size_core(capital, initial_capital, max_position_size, has_ai_size, ai_size,
+                        confidence, momentum, volatility, regime_code, use_leverage_scaling,
+                        consecutive_wins, consecutive_losses, hot_streak_multiplier,
+                        size_reduction_dd):
+    """Numeric core of AggressiveBot.calculate_position_size
+    
+    Returns (size, hot_streak_multiplier) - the updated streak multiplier is
+    handed back rather than stored so the kernel stays free of bot state.
+    """
+    base_size = capital * max_position_size
+    upper = capital * 0.20  # Max 20% per trade (reduced from 40%)
+    lower = capital * 0.02  # Min 2% per trade
+    
+    # AI-enhanced sizing - take larger of the two
+    if has_ai_size:
+        base_size = max(base_size, ai_size * capital)
+    
+    confidence_mult = 0.7 + (confidence * 0.6)  # 70%-130% based on confidence
+    momentum_mult = 0.8 + (momentum * 0.4)      # 80%-120% based on momentum
+    
+    # Hot streak multiplier (increase size during winning streaks)
+    if consecutive_wins >= 3:
+        hot_streak_multiplier = min(2.0, 1 + (consecutive_wins * 0.1))  # Max 2x
+    else:
+        hot_streak_multiplier = max(1.0, hot_streak_multiplier * 0.95)
+    
+    # Cold streak protection (reduce size during losing streaks)
+    cold_streak_mult = 1.0
+    if consecutive_losses >= 2:
+        cold_streak_mult = max(0.3, 1 - (consecutive_losses * 0.15))
+    
+    # Leverage scaling based on volatility and regime
+    leverage_mult = 1.0
+    if use_leverage_scaling:
+        vol_leverage = min(1.5, 1 + (volatility * 2))  # High volatility = higher leverage potential
+        leverage_mult = vol_leverage * AGGRESSIVE_TABLE[regime_code][3]
+    
+    # Size reduction for approaching drawdown limit (cut size in half)
+    current_dd = (initial_capital - capital) / initial_capital
+    size_reduction_factor = 0.5 if current_dd > size_reduction_dd else 1.0
+    
+    final_size = _final_size(base_size, confidence_mult, momentum_mult, hot_streak_multiplier,
+                             cold_streak_mult, leverage_mult, size_reduction_factor)
+    
+    # Tighter aggressive bounds
+    return max(lower, min(upper, final_size)), hot_streak_multiplier
+
+
+@njit(cache=True)
+def _backtest_core(capital, initial_capital, consecutive_wins, consecutive_losses,
+                   hot_streak_multiplier, has_ai_size, ai_size, confidence, momentum,
+                   trend_strength, breakout_score, volatility, regime_code, rand,
+                   max_position_size, stop_loss, dd_limit, size_reduction_dd,
+                   use_leverage_scaling):
+    """Path-dependent trade loop over bars that already passed the signal filter
+    
+    Returns the number of trades taken, the final (capital, consecutive_wins,
+    consecutive_losses, hot_streak_multiplier) and per-trade size, pnl, pct,
+    win flag, streak and hot multiplier arrays.
+    """
+    n = confidence.shape[0]
+    sizes = np.empty(n)
+    pnls = np.empty(n)
+    pcts = np.empty(n)
+    wins = np.empty(n, dtype=np.bool_)
+    streaks = np.empty(n, dtype=np.int64)
+    hots = np.empty(n)
+    
+    k = 0
+    for i in range(n):
+        if (initial_capital - capital) / initial_capital > dd_limit:
+            break
+        
+        trade_size, hot_streak_multiplier = _position_size_core(
+            capital, initial_capital, max_position_size, has_ai_size[i], ai_size[i],
+            confidence[i], momentum[i], volatility[i], regime_code[i], use_leverage_scaling,
+            consecutive_wins, consecutive_losses, hot_streak_multiplier, size_reduction_dd)
+        
+        is_win, pnl, pct = _trade_core(trade_size, confidence[i], momentum[i], trend_strength[i],
+                                       breakout_score[i], regime_code[i], consecutive_wins,
+                                       stop_loss, rand[i, 0], rand[i, 1])
+        capital += pnl
+        
+        if is_win:
+            consecutive_wins += 1
+            consecutive_losses = 0
+        else:
+            consecutive_losses += 1
+            consecutive_wins = 0
+            hot_streak_multiplier = max(1.0, hot_streak_multiplier * 0.9)
+        
+        sizes[k] = trade_size
+        pnls[k] = pnl
+        pcts[k] = pct
+        wins[k] = is_win
+        streaks[k] = consecutive_wins if is_win else consecutive_losses
+        hots[k] = hot_streak_multiplier
+        k += 1
+    
+    return (k, capital, consecutive_wins, consecutive_losses, hot_streak_multiplier,
+            sizes, pnls, pcts, wins, streaks, hots)
+
+
+@njit(cache=True, parallel=True)
+def _simulate_ensemble(capitals, has_ai_size, ai_size, confidence, momentum, trend_strength,
+                       breakout_score, volatility, regime_code, rand, max_position_size,
+                       stop_loss, dd_limit, size_reduction_dd, use_leverage_scaling):
+    """Run one bot per starting capital over the same signal bars, in parallel"""
+    n_bots = capitals.shape[0]
+    final_capitals = np.empty(n_bots)
+    
+    for b in prange(n_bots):
+        result = _backtest_core(capitals[b], capitals[b], 0, 0, 1.0, has_ai_size, ai_size,
+                                confidence, momentum, trend_strength, breakout_score,
+                                volatility, regime_code, rand[b], max_position_size,
+                                stop_loss, dd_limit, size_reduction_dd, use_leverage_scaling)
+        final_capitals[b] = result[1]
+    
+    return final_capitals
+
+
+def _signal_columns(arrays, signal_idx):
+    """Extract the trading-path columns at signal_idx as contiguous arrays
+    
+    Returns (has_ai_size, ai_size, confidence, |momentum|, trend_strength,
+    breakout_score, volatility, regime_code) with the scalar-path defaults
+    for missing columns.
+    """
+    n = len(arrays[next(iter(arrays))])
+    
+    def column(key, default):
+        if key in arrays:
+            return np.asarray(arrays[key], dtype=np.float64)[signal_idx]
+        return np.full(len(signal_idx), default)
+    
+    return (np.full(len(signal_idx), 'position_size' in arrays),
+            column('position_size', 0.0),
+            column('ai_confidence', 0.5),
+            np.abs(column('momentum', 0.5)),
+            column('trend_strength', 0.5),
+            column('breakout_score', 0.5),
+            column('volatility', 0.1),
+            encode_regimes(arrays.get('regime', np.full(n, REGIME_UNKNOWN)))[signal_idx])
+
+
+def simulate_ensemble(capitals, arrays, seed=None, **kwargs):
+    """Simulate one AggressiveBot per starting capital over a shared bar series
+    
+    `arrays` holds signal_ok_batch-style columns; bots are configured with the
+    AggressiveBot kwargs and differ only in capital and random draws. Runs in
+    parallel across bots when numba is installed. Bars are treated as one
+    continuous session: max_daily_trades is not enforced, unlike trade().
+    Returns the final capitals.
+    """
+    if np is None:
+        raise ImportError("simulate_ensemble requires numpy")
+    
+    params = AggressiveBot(1.0, **kwargs)
+    capitals = np.asarray(capitals, dtype=np.float64)
+    
+    # Only bars that pass the signal filter can trade
+    signal_idx = np.flatnonzero(AggressiveBot.signal_ok_batch(arrays))
+    rand = np.random.default_rng(seed).random((len(capitals), len(signal_idx), 2))
+    
+    return _simulate_ensemble(
+        capitals, *_signal_columns(arrays, signal_idx), rand,
+        params.max_position_size, params.stop_loss, params.dd_limit,
+        params.size_reduction_dd, bool(params.use_leverage_scaling))
+
 
 class AggressiveBot:
-    def __init__(self, capital, mode="aggressive", **kwargs):
-        self.capital = capital
-        self.initial_capital = capital
-        self.leverage = kwargs.get('leverage', 3)  # Reduced leverage for tighter control
-        self.mode = mode
-        self.dd_limit = kwargs.get('max_drawdown', 0.18)  # Tightened to 18% max drawdown
-        self.max_position_size = kwargs.get('max_position', 0.15)  # Reduced to 15% per trade
-        self.risk_multiplier = kwargs.get('risk_multiplier', 1.5)  # Reduced risk multiplier
+    __slots__ = (
+        'capital', 'initial_capital', 'leverage', 'mode', 'dd_limit', 'max_position_size',
+        'risk_multiplier', 'target_return', 'stop_loss', 'take_profit', 'max_daily_trades',
+        'emergency_stop_dd', 'size_reduction_dd',
+        'use_leverage_scaling', 'momentum_trading', 'breakout_focus', 'verbose',
+        'daily_trades', 'consecutive_wins', 'consecutive_losses', 'max_consecutive_wins',
+        'peak_capital', 'daily_pnl', 'hot_streak_multiplier',
+        '_h_size', '_h_pnl', '_h_pct', '_h_conf', '_h_regime', '_h_win', '_h_streak', '_h_hot', '_h_ts',
+        '_recent', '_rng', '_rand_pool', '_rand_idx'
+    )
+    
+    def __init__(self, capital: float, mode: str = "aggressive", **kwargs) -> None:
+        self.capital: float = capital
+        self.initial_capital: float = capital
+        self.leverage: float = kwargs.get('leverage', 3)  # Reduced leverage for tighter control
+        self.mode: str = mode
+        self.dd_limit: float = kwargs.get('max_drawdown', 0.18)  # Tightened to 18% max drawdown
+        self.max_position_size: float = kwargs.get('max_position', 0.15)  # Reduced to 15% per trade
+        self.risk_multiplier: float = kwargs.get('risk_multiplier', 1.5)  # Reduced risk multiplier
         
         # Aggressive trading parameters (tightened)
-        self.target_return = kwargs.get('target_return', 0.06)  # Reduced to 6% daily target
-        self.stop_loss = kwargs.get('stop_loss', 0.02)  # Tighter 2% stop loss
-        self.take_profit = kwargs.get('take_profit', 0.10)  # Reduced take profit
-        self.max_daily_trades = kwargs.get('max_daily_trades', 15)  # Reduced trades
+        self.target_return: float = kwargs.get('target_return', 0.06)  # Reduced to 6% daily target
+        self.stop_loss: float = kwargs.get('stop_loss', 0.02)  # Tighter 2% stop loss
+        self.take_profit: float = kwargs.get('take_profit', 0.10)  # Reduced take profit
+        self.max_daily_trades: int = kwargs.get('max_daily_trades', 15)  # Reduced trades
         
         # Tighter risk controls
-        self.emergency_stop_dd = 0.15  # Emergency stop at 15%
-        self.size_reduction_dd = 0.12  # Start reducing size at 12%
+        self.emergency_stop_dd: float = 0.15  # Emergency stop at 15%
+        self.size_reduction_dd: float = 0.12  # Start reducing size at 12%
         
         # AI enhancements
-        self.use_leverage_scaling = kwargs.get('leverage_scaling', True)
-        self.momentum_trading = kwargs.get('momentum_trading', True)
-        self.breakout_focus = kwargs.get('breakout_focus', True)
-        
-        # Performance tracking
-        self.daily_trades = 0
-        self.consecutive_wins = 0
-        self.consecutive_losses = 0
-        self.max_consecutive_wins = 0
-        self.trade_history = []
-        self.peak_capital = capital
-        self.daily_pnl = 0
-        self.hot_streak_multiplier = 1.0
-        
-    def signal_ok(self, data):
-        """Aggressive signal detection - looking for strong momentum and breakouts"""
-        momentum = data.get('momentum', 0.5)
-        trend_strength = data.get('trend_strength', 0.5)
-        breakout_score = data.get('breakout_score', 0.5)
-        volatility = data.get('volatility', 0.1)
-        volume_spike = data.get('volume_spike', False)
-        ai_confidence = data.get('ai_confidence', 0.5)
-        regime = data.get('regime', 'unknown')
-        
-        # Aggressive requirements - we want HIGH momentum and volatility
-        momentum_ok = abs(momentum) > 0.6  # Strong directional momentum
-        trend_ok = trend_strength > 0.55   # Strong trend
-        breakout_ok = breakout_score > 0.7 # Strong breakout signal
-        vol_ok = volatility > 0.04         # Sufficient volatility for profits
-        confidence_ok = ai_confidence > 0.6 # AI confidence
-        
-        # Volume confirmation (aggressive traders need liquidity)
-        volume_ok = volume_spike or data.get('volume_ratio', 1.0) > 1.3
-        
-        # Regime preferences for aggressive trading
-        regime_ok = True
-        if regime in ['high_volatility', 'trending_bull', 'trending_bear']:
-            regime_ok = True  # Love volatility and trends
-        elif regime == 'sideways':
-            # Still trade sideways but with higher requirements
-            momentum_ok = abs(momentum) > 0.75
-            breakout_ok = breakout_score > 0.8
-        elif regime == 'low_volatility':
-            # Avoid low volatility unless signals are exceptional
-            if volatility < 0.03:
-                return False
-        
-        # Special aggressive filters
-        rsi = data.get('rsi', 50)
-        rsi_extreme = rsi < 25 or rsi > 75  # Want extreme RSI for aggressive entries
-        
-        confluence = data.get('confluence', 0.5)
-        confluence_ok = confluence > 0.65
-        
-        return all([momentum_ok, trend_ok, breakout_ok, vol_ok, confidence_ok, 
-                   volume_ok, regime_ok, rsi_extreme, confluence_ok])
-    
-    def calculate_position_size(self, data):
-        """Aggressive position sizing with leverage and hot streak bonuses"""
-        base_size = self.capital * self.max_position_size
-        
-        # AI-enhanced sizing
-        if 'position_size' in data:
-            ai_suggested_size = data['position_size'] * self.capital
-            base_size = max(base_size, ai_suggested_size)  # Take larger of the two
+        self.use_leverage_scaling: bool = kwargs.get('leverage_scaling', True)
+        self.momentum_trading: bool = kwargs.get('momentum_trading', True)
+        self.breakout_focus: bool = kwargs.get('breakout_focus', True)
         
-        # Confidence multiplier
-        confidence = data.get('ai_confidence', 0.5)
-        confidence_mult = 0.7 + (confidence * 0.6)  # 70%-130% based on confidence
+        # Headless backtests can skip message formatting (trade() returns tuples)
+        self.verbose: bool = kwargs.get('verbose', True)
         
-        # Momentum multiplier (aggressive loves momentum)
-        momentum = abs(data.get('momentum', 0.5))
-        momentum_mult = 0.8 + (momentum * 0.4)  # 80%-120% based on momentum
-        
-        # Hot streak multiplier (increase size during winning streaks)
-        if self.consecutive_wins >= 3:
-            self.hot_streak_multiplier = 1 + (self.consecutive_wins * 0.1)
-            self.hot_streak_multiplier = min(2.0, self.hot_streak_multiplier)  # Max 2x
+        # Performance tracking
+        self.daily_trades: int = 0
+        self.consecutive_wins: int = 0
+        self.consecutive_losses: int = 0
+        self.max_consecutive_wins: int = 0
+        self.peak_capital: float = capital
+        self.daily_pnl: float = 0
+        self.hot_streak_multiplier: float = 1.0
+        
+        # Columnar trade history (one compact array per field)
+        self._h_size: array = array('d')
+        self._h_pnl: array = array('d')      # Signed: profit on wins, -loss on losses
+        self._h_pct: array = array('d')
+        self._h_conf: array = array('d')
+        self._h_regime: array = array('b')
+        self._h_win: array = array('b')
+        self._h_streak: array = array('l')
+        self._h_hot: array = array('d')
+        self._h_ts: array = array('q')       # time.time_ns()
+        
+        # Rolling (is_win, pnl) window for get_status
+        self._recent: deque = deque(maxlen=25)
+        
+        # Per-bot RNG drawn in batches (numpy PCG64 when available)
+        seed = kwargs.get('seed')
+        self._rng: 'np.random.Generator | random.Random' = (
+            np.random.default_rng(seed) if np is not None else random.Random(seed))
+        self._rand_pool: list[float] = []
+        self._rand_idx: int = 0
+        
+    @property
+    def trade_history(self) -> list[dict]:
+        """Trade log as a list of dicts, rebuilt on demand from the columnar store"""
+        history = []
+        for i in range(len(self._h_win)):
+            record = {
+                'timestamp': iso_ns(self._h_ts[i]),
+                'type': 'WIN' if self._h_win[i] else 'LOSS',
+                'size': self._h_size[i]
+            }
+            if self._h_win[i]:
+                record['profit'] = self._h_pnl[i]
+                record['profit_pct'] = self._h_pct[i]
+            else:
+                record['loss'] = -self._h_pnl[i]
+                record['loss_pct'] = self._h_pct[i]
+            record['confidence'] = self._h_conf[i]
+            record['regime'] = REGIME_BY_CODE[self._h_regime[i]]
+            record['streak'] = self._h_streak[i]
+            if self._h_win[i]:
+                record['hot_streak_mult'] = self._h_hot[i]
+            history.append(record)
+        return history
+    
+    def _rand(self) -> float:
+        """Next uniform [0, 1) draw, refilling the pool in one batch when empty"""
+        if self._rand_idx == len(self._rand_pool):
+            if np is not None:
+                self._rand_pool = self._rng.random(_RAND_POOL_SIZE).tolist()
+            else:
+                self._rand_pool = [self._rng.random() for _ in range(_RAND_POOL_SIZE)]
+            self._rand_idx = 0
+        r = self._rand_pool[self._rand_idx]
+        self._rand_idx += 1
+        return r
+    
+    def _record_trade(self, is_win: bool, size: float, pnl: float, pct: float,
+                      confidence: float, regime_code: int, streak: int) -> None:
+        """Append one trade to the columnar history"""
+        self._h_size.append(size)
+        self._h_pnl.append(pnl)
+        self._h_pct.append(pct)
+        self._h_conf.append(confidence)
+        self._h_regime.append(regime_code)
+        self._h_win.append(is_win)
+        self._h_streak.append(streak)
+        self._h_hot.append(self.hot_streak_multiplier)
+        self._h_ts.append(time.time_ns())
+        self._recent.append((is_win, pnl))
+    
+    @staticmethod
+    def _unpack(data: dict) -> Signal:
+        """Read every field the trading path needs from a data dict, once"""
+        get = data.get
+        return Signal(get('momentum', 0.5), get('trend_strength', 0.5), get('breakout_score', 0.5),
+                      get('volatility', 0.1), get('volume_spike', False), get('ai_confidence', 0.5),
+                      REGIME_CODES.get(get('regime'), REGIME_UNKNOWN), get('rsi', 50),
+                      get('confluence', 0.5), get('volume_ratio', 1.0), get('position_size'))
+    
+    @classmethod
+    def _as_signal(cls, data: dict | Signal) -> Signal:
+        """Signal from a data dict, or a caller-built Signal with its regime resolved to a code
+        
+        Regime names, Regime members and out-of-range codes in a ready-made
+        tuple are mapped like _unpack maps them, so the tables only ever see
+        codes 0-5.
+        """
+        if not isinstance(data, Signal):
+            return cls._unpack(data)
+        code = REGIME_CODES.get(data.regime, REGIME_UNKNOWN)
+        return data if code is data.regime else data._replace(regime=code)
+    
+    def signal_ok(self, data: dict | Signal) -> bool:
+        """Aggressive signal detection - looking for strong momentum and breakouts
+        
+        Accepts a data dict or an unpacked Signal. Filters run most-selective
+        first and return on the first failure.
+        """
+        sig = self._as_signal(data)
+        
+        # AI confidence
+        if not sig.ai_confidence > 0.6:
+            return False
+        
+        # Want extreme RSI for aggressive entries
+        if not (sig.rsi < 25 or sig.rsi > 75):
+            return False
+        
+        # Strong directional momentum and breakout - sideways markets still
+        # trade, but with higher requirements
+        if sig.regime == REGIME_SIDEWAYS:
+            momentum_min, breakout_min = 0.75, 0.8
         else:
-            self.hot_streak_multiplier = max(1.0, self.hot_streak_multiplier * 0.95)
-        
-        # Cold streak protection (reduce size during losing streaks)
-        cold_streak_mult = 1.0
-        if self.consecutive_losses >= 2:
-            cold_streak_mult = max(0.3, 1 - (self.consecutive_losses * 0.15))
-        
-        # Leverage scaling based on volatility and regime
-        leverage_mult = 1.0
-        if self.use_leverage_scaling:
-            volatility = data.get('volatility', 0.1)
-            regime = data.get('regime', 'unknown')
-            
-            # High volatility = higher leverage potential
-            vol_leverage = min(1.5, 1 + (volatility * 2))
-            
-            # Regime-based leverage
-            regime_leverage = {
-                'trending_bull': 1.3,
-                'trending_bear': 1.2,
-                'high_volatility': 1.4,
-                'sideways': 0.8,
-                'low_volatility': 0.9
-            }.get(regime, 1.0)
-            
-            leverage_mult = vol_leverage * regime_leverage
+            momentum_min, breakout_min = 0.6, 0.7
+        if not abs(sig.momentum) > momentum_min:
+            return False
+        if not sig.breakout_score > breakout_min:
+            return False
         
-        # Size reduction for approaching drawdown limit
-        current_dd = (self.initial_capital - self.capital) / self.initial_capital
-        if current_dd > self.size_reduction_dd:
-            size_reduction_factor = 0.5  # Cut size in half
-        else:
-            size_reduction_factor = 1.0
+        # Strong trend
+        if not sig.trend_strength > 0.55:
+            return False
         
-        # Apply all multipliers with size reduction
-        final_size = (base_size * confidence_mult * momentum_mult * 
-                     self.hot_streak_multiplier * cold_streak_mult * leverage_mult * size_reduction_factor)
+        # Sufficient volatility for profits (also covers the low_volatility
+        # regime's 3% cutoff)
+        if not sig.volatility > 0.04:
+            return False
         
-        # Tighter aggressive bounds
-        final_size = min(final_size, self.capital * 0.20)  # Max 20% per trade (reduced from 40%)
-        final_size = max(final_size, self.capital * 0.02)  # Min 2% per trade
+        # Volume confirmation (aggressive traders need liquidity)
+        if not (sig.volume_spike or sig.volume_ratio > 1.3):
+            return False
         
+        return sig.confluence > 0.65
+    
+    @classmethod
+    def signal_ok_batch(cls, arrays: Any) -> 'np.ndarray':
+        """Vectorized signal_ok over a batch of bars - returns a boolean mask
+        
+        `arrays` maps the signal_ok keys to equal-length columns; missing
+        columns fall back to the same defaults as the scalar path.
+        """
+        if np is None:
+            raise ImportError("signal_ok_batch requires numpy")
+        
+        n = len(arrays[next(iter(arrays))])
+        
+        def column(key: str, default: float) -> 'np.ndarray':
+            if key in arrays:
+                return np.asarray(arrays[key])
+            return np.full(n, default)
+        
+        momentum = np.abs(column('momentum', 0.5))
+        trend_strength = column('trend_strength', 0.5)
+        breakout_score = column('breakout_score', 0.5)
+        volatility = column('volatility', 0.1)
+        volume_spike = column('volume_spike', False).astype(bool)
+        ai_confidence = column('ai_confidence', 0.5)
+        rsi = column('rsi', 50)
+        confluence = column('confluence', 0.5)
+        volume_ratio = column('volume_ratio', 1.0)
+        
+        regime_code = encode_regimes(column('regime', 'unknown'))
+        sideways = regime_code == REGIME_SIDEWAYS
+        low_volatility = regime_code == REGIME_LOWVOL
+        
+        # Sideways markets need stronger momentum and breakouts
+        momentum_ok = np.where(sideways, momentum > 0.75, momentum > 0.6)
+        breakout_ok = np.where(sideways, breakout_score > 0.8, breakout_score > 0.7)
+        
+        return functools.reduce(np.logical_and, [
+            momentum_ok,
+            trend_strength > 0.55,
+            breakout_ok,
+            volatility > 0.04,
+            ai_confidence > 0.6,
+            volume_spike | (volume_ratio > 1.3),
+            ~(low_volatility & (volatility < 0.03)),
+            (rsi < 25) | (rsi > 75),
+            confluence > 0.65,
+        ])
+    
+    def backtest(self, bars: Any) -> 'np.ndarray':
+        """Vectorized multi-bar backtest - returns the per-bar PnL array
+        
+        `bars` is a DataFrame or dict of signal_ok_batch-style columns. The
+        signal filter and column prep run over the whole series at once; only
+        bars that pass the filter go through the path-dependent trade loop.
+        Capital, peak, streaks and trade history are updated as if trade() had
+        been called on each bar. The bars are treated as one continuous
+        session, so unlike trade() max_daily_trades is not enforced, and the
+        daily counters (daily_trades, daily_pnl) are left untouched.
+        """
+        if np is None:
+            raise ImportError("backtest requires numpy")
+        
+        n = len(bars[next(iter(bars))])
+        signal_idx = np.flatnonzero(self.signal_ok_batch(bars))
+        columns = _signal_columns(bars, signal_idx)
+        rand = self._rng.random((len(signal_idx), 2))
+        
+        (k, capital, self.consecutive_wins, self.consecutive_losses, hot_streak_multiplier,
+         sizes, pnls, pcts, wins, streaks, hots) = _backtest_core(
+            float(self.capital), self.initial_capital, self.consecutive_wins,
+            self.consecutive_losses, self.hot_streak_multiplier, *columns, rand,
+            self.max_position_size, self.stop_loss, self.dd_limit, self.size_reduction_dd,
+            bool(self.use_leverage_scaling))
+        self.hot_streak_multiplier = float(hot_streak_multiplier)
+        
+        pnls, wins = pnls[:k], wins[:k]
+        if k:
+            self.peak_capital = max(self.peak_capital, float(np.cumsum(np.append(self.capital, pnls)).max()))
+            self.capital = float(capital)
+            if wins.any():
+                self.max_consecutive_wins = max(self.max_consecutive_wins, int(streaks[:k][wins].max()))
+        
+        # Bulk-append the trades to the columnar history
+        self._h_size.extend(sizes[:k].tolist())
+        self._h_pnl.extend(pnls.tolist())
+        self._h_pct.extend(pcts[:k].tolist())
+        self._h_conf.extend(columns[2][:k].tolist())
+        self._h_regime.extend(columns[7][:k].tolist())
+        self._h_win.extend(wins.tolist())
+        self._h_streak.extend(streaks[:k].tolist())
+        self._h_hot.extend(hots[:k].tolist())
+        self._h_ts.extend([time.time_ns()] * k)
+        self._recent.extend(zip(wins.tolist(), pnls.tolist()))
+        
+        bar_pnl = np.zeros(n)
+        bar_pnl[signal_idx[:k]] = pnls
+        return bar_pnl
+    
+    def calculate_position_size(self, data: dict | Signal) -> float:
+        """Aggressive position sizing with leverage and hot streak bonuses"""
+        sig = self._as_signal(data)
+        has_ai_size = sig.position_size is not None
+        final_size, self.hot_streak_multiplier = _position_size_core(
+            self.capital, self.initial_capital, self.max_position_size,
+            has_ai_size, sig.position_size if has_ai_size else 0.0,
+            sig.ai_confidence, abs(sig.momentum), sig.volatility, sig.regime,
+            self.use_leverage_scaling, self.consecutive_wins, self.consecutive_losses,
+            self.hot_streak_multiplier, self.size_reduction_dd)
         return final_size
     
-    def trade(self, data):
+    def trade(self, data: dict | Signal) -> str | tuple:
         """Execute aggressive trade with full risk management"""
+        return self.trade_with(data)
+    
+    def trade_with(self, sig: dict | Signal) -> str | tuple:
+        """Execute aggressive trade from an unpacked Signal (or a data dict)"""
+        sig = self._as_signal(sig)
         if self.daily_trades >= self.max_daily_trades:
             return "⏸️ Daily trade limit reached"
         
@@ -158,61 +549,24 @@ class AggressiveBot:
             return f"🚨 AGGRESSIVE STOP: Drawdown {current_dd:.1%} exceeds {self.dd_limit:.1%}"
         
         # Signal validation
-        if not self.signal_ok(data):
+        if not self.signal_ok(sig):
             return "🚫 No trade — insufficient aggressive confluence"
         
         # Position sizing
-        trade_size = self.calculate_position_size(data)
+        trade_size = self.calculate_position_size(sig)
         
         # Aggressive execution with enhanced probabilities
-        confidence = data.get('ai_confidence', 0.5)
-        momentum = abs(data.get('momentum', 0.5))
-        trend_strength = data.get('trend_strength', 0.5)
-        breakout_score = data.get('breakout_score', 0.5)
-        regime = data.get('regime', 'unknown')
-        
-        # Aggressive success probability calculation
-        base_success_prob = (confidence + momentum + trend_strength + breakout_score) / 4
-        
-        # Hot streak bonus
-        streak_bonus = min(0.15, self.consecutive_wins * 0.03)
-        
-        # Regime-specific success rates for aggressive trading
-        regime_success_adj = {
-            'trending_bull': 1.2,
-            'trending_bear': 1.15,
-            'high_volatility': 1.1,  # Aggressive thrives in volatility
-            'sideways': 0.9,
-            'low_volatility': 0.85
-        }
+        confidence = sig.ai_confidence
+        regime_code = sig.regime
         
-        final_success_prob = (base_success_prob + streak_bonus) * regime_success_adj.get(regime, 1.0)
-        final_success_prob = min(0.80, max(0.25, final_success_prob))
+        is_win, pnl, pct = _trade_core(trade_size, confidence, abs(sig.momentum), sig.trend_strength,
+                                       sig.breakout_score, regime_code, self.consecutive_wins,
+                                       self.stop_loss, self._rand(), self._rand())
         
-        # Execute trade
-        if random.random() < final_success_prob:
-            # WINNING TRADE - Aggressive profit calculation
-            base_profit_pct = random.uniform(0.05, 0.15)  # Higher base profits
-            
-            # Aggressive bonuses
-            confidence_bonus = 1 + ((confidence - 0.5) * 0.6)  # Bigger confidence bonus
-            momentum_bonus = 1 + (momentum * 0.4)             # Momentum bonus
-            hot_streak_bonus = 1 + (self.consecutive_wins * 0.05)  # Streak bonus
-            
-            # Regime profit multipliers (aggressive gets bigger moves)
-            regime_profit_mult = {
-                'trending_bull': 1.5,
-                'trending_bear': 1.3,
-                'high_volatility': 1.6,  # Biggest profits in volatility
-                'sideways': 1.0,
-                'low_volatility': 0.9
-            }.get(regime, 1.0)
-            
-            final_profit_pct = (base_profit_pct * confidence_bonus * momentum_bonus * 
-                               hot_streak_bonus * regime_profit_mult)
-            final_profit_pct = min(0.18, final_profit_pct)  # Reduced cap to 18%
-            
-            profit = trade_size * final_profit_pct
+        if is_win:
+            # WINNING TRADE
+            final_profit_pct = pct
+            profit = pnl
             self.capital += profit
             self.daily_pnl += profit
             
@@ -228,38 +582,17 @@ class AggressiveBot:
             self.daily_trades += 1
             
             # Log trade
-            trade_record = {
-                'timestamp': datetime.utcnow().isoformat(),
-                'type': 'WIN',
-                'size': trade_size,
-                'profit': profit,
-                'profit_pct': final_profit_pct,
-                'confidence': confidence,
-                'regime': regime,
-                'streak': self.consecutive_wins,
-                'hot_streak_mult': self.hot_streak_multiplier
-            }
-            self.trade_history.append(trade_record)
+            self._record_trade(True, trade_size, profit, final_profit_pct, confidence,
+                               regime_code, self.consecutive_wins)
             
-            return f"🔥 AGGRESSIVE WIN | +${profit:.2f} ({final_profit_pct:.1%}) | Capital: ${self.capital:.2f} | Streak: {self.consecutive_wins}W | Hot: {self.hot_streak_multiplier:.1f}x"
+            if not self.verbose:
+                return ('WIN', profit, final_profit_pct)
+            return self._fmt_win(profit, final_profit_pct)
             
         else:
-            # LOSING TRADE - Aggressive stop loss
-            base_loss_pct = self.stop_loss
-            
-            # Regime-adjusted stop loss
-            regime_loss_adj = {
-                'trending_bull': 0.8,   # Tighter stops in trends
-                'trending_bear': 0.9,
-                'high_volatility': 1.4, # Wider stops in volatility
-                'sideways': 1.2,
-                'low_volatility': 0.7
-            }.get(regime, 1.0)
-            
-            adjusted_loss_pct = base_loss_pct * regime_loss_adj
-            adjusted_loss_pct = min(0.06, adjusted_loss_pct)  # Cap at 6%
-            
-            loss = trade_size * adjusted_loss_pct
+            # LOSING TRADE
+            adjusted_loss_pct = pct
+            loss = -pnl
             self.capital -= loss
             self.daily_pnl -= loss
             
@@ -271,42 +604,46 @@ class AggressiveBot:
             self.daily_trades += 1
             
             # Log trade
-            trade_record = {
-                'timestamp': datetime.utcnow().isoformat(),
-                'type': 'LOSS',
-                'size': trade_size,
-                'loss': loss,
-                'loss_pct': adjusted_loss_pct,
-                'confidence': confidence,
-                'regime': regime,
-                'streak': self.consecutive_losses
-            }
-            self.trade_history.append(trade_record)
+            self._record_trade(False, trade_size, -loss, adjusted_loss_pct, confidence,
+                               regime_code, self.consecutive_losses)
             
-            return f"❌ AGGRESSIVE LOSS | -${loss:.2f} ({adjusted_loss_pct:.1%}) | Capital: ${self.capital:.2f} | Streak: {self.consecutive_losses}L | Regime: {regime}"
+            if not self.verbose:
+                return ('LOSS', loss, adjusted_loss_pct)
+            return self._fmt_loss(loss, adjusted_loss_pct, regime_code)
+    
+    def _fmt_win(self, profit: float, pct: float) -> str:
+        """Display message for a winning trade"""
+        return f"🔥 AGGRESSIVE WIN | +${profit:.2f} ({pct:.1%}) | Capital: ${self.capital:.2f} | Streak: {self.consecutive_wins}W | Hot: {self.hot_streak_multiplier:.1f}x"
+    
+    def _fmt_loss(self, loss: float, pct: float, regime_code: int) -> str:
+        """Display message for a losing trade"""
+        return f"❌ AGGRESSIVE LOSS | -${loss:.2f} ({pct:.1%}) | Capital: ${self.capital:.2f} | Streak: {self.consecutive_losses}L | Regime: {REGIME_BY_CODE[regime_code]}"
     
-    def reset_daily_stats(self):
+    def reset_daily_stats(self) -> None:
         """Reset daily counters"""
         self.daily_trades = 0
         self.daily_pnl = 0
     
-    def get_status(self):
+    def get_status(self) -> dict:
         """Comprehensive aggressive strategy status"""
         current_dd = (self.initial_capital - self.capital) / self.initial_capital if self.initial_capital > 0 else 0
         total_return = (self.capital - self.initial_capital) / self.initial_capital if self.initial_capital > 0 else 0
         daily_return = self.daily_pnl / self.capital if self.capital > 0 else 0
         
-        # Calculate win rate
-        recent_trades = self.trade_history[-25:] if len(self.trade_history) >= 25 else self.trade_history
-        wins = len([t for t in recent_trades if t['type'] == 'WIN'])
-        win_rate = wins / len(recent_trades) if recent_trades else 0
-        
-        # Calculate average profit per trade
-        winning_trades = [t for t in recent_trades if t['type'] == 'WIN']
-        avg_win = sum(t['profit'] for t in winning_trades) / len(winning_trades) if winning_trades else 0
-        
-        losing_trades = [t for t in recent_trades if t['type'] == 'LOSS']
-        avg_loss = sum(t['loss'] for t in losing_trades) / len(losing_trades) if losing_trades else 0
+        # Win rate and average profit/loss over the last 25 trades, in one pass
+        wins = losses = 0
+        win_total = loss_total = 0.0
+        for is_win, pnl in self._recent:
+            if is_win:
+                wins += 1
+                win_total += pnl
+            else:
+                losses += 1
+                loss_total -= pnl
+        
+        win_rate = wins / len(self._recent) if self._recent else 0
+        avg_win = win_total / wins if wins else 0
+        avg_loss = loss_total / losses if losses else 0
         
         return {
             "strategy": "AggressiveBot",
@@ -321,7 +658,7 @@ class AggressiveBot:
             "max_win_streak": self.max_consecutive_wins,
             "hot_streak_multiplier": f"{self.hot_streak_multiplier:.1f}x",
             "daily_trades": self.daily_trades,
-            "total_trades": len(self.trade_history),
+            "total_trades": len(self._h_win),
             "win_rate": f"{win_rate:.1%}",
             "avg_win": f"${avg_win:.2f}",
             "avg_loss": f"${avg_loss:.2f}",
@@ -329,5 +666,5 @@ class AggressiveBot:
             "leverage": self.leverage,
             "risk_level": "AGGRESSIVE",
             "ai_enhanced": True,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": iso_ns(time.time_ns())
         }
@@ -1,7 +1,204 @@
 # conservative.py - AI-Enhanced Ultra-Conservative Strategy (3% DD, 1% Daily)
 import random
-import math
-from datetime import datetime
+import time
+from array import array
+from collections import deque, namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the batch helpers
+    np = None
+
+from ._kernels import load_aot
+from ._njit import njit
+from ._timefmt import iso_ns
+from ._regime_tables import (Regime, REGIME_UNKNOWN, REGIME_CODES, REGIME_BY_CODE, CONSERVATIVE_OK,
+                             CONSERVATIVE_SUCCESS, CONSERVATIVE_PROFIT, CONSERVATIVE_LOSS, encode_regimes)
+
+# Regime is re-exported so callers can build Metrics tuples without reaching into _regime_tables
+__all__ = ['ConservativeBot', 'Metrics', 'Regime']
+
+# One tick's worth of market metrics, unpacked once from the metrics dict
+# (regime holds the integer code - a name, code or Regime member goes in -
+# and position_size is None when absent)
+Metrics = namedtuple('Metrics', 'spread volume volatility ai_confidence regime support_resistance '
+                                'trend_strength confluence rsi volume_profile position_size')
+
+
+@njit(cache=True, inline='always')
+def _clip(x, lo, hi):
+    """Clamp x to [lo, hi] - inlined into the kernels, no min/max dispatch"""
+    return lo if x < lo else hi if x > hi else x
+
+
+@njit(cache=True)
+def _m_factor(dd, d_max):
+    """Drawdown modulation M = max(0, 1 - dd/d_max): full size at the peak, zero at d_max
+    
+    A d_max of zero (or below) tolerates no drawdown, so M is zero throughout.
+    """
+    if d_max <= 0:
+        return 0.0
+    return max(0.0, 1.0 - dd / d_max)
+
+
+@njit(cache=True)
+def _position_size_core(capital, peak_distance, daily_return, daily_target, kelly_fraction,
+                        d_max, risk_cap, has_ai_size, ai_size, confidence, recent_wins,
+                        recent_count):
+    """Ultra-conservative position sizing - shared by trade() and simulate()
+    
+    Takes the distance from peak and daily return ready-made; callers keep
+    them up to date as capital changes.
+    """
+    # Start with a fractional-Kelly base size (1% by default)
+    base_size = capital * kelly_fraction
+    
+    # AI sizing (but capped conservatively)
+    if has_ai_size:
+        # Take smaller of AI suggestion and conservative limit
+        base_size = min(base_size, ai_size * capital, capital * risk_cap)
+    
+    # Staircases below are branchless: a tuple of steps indexed by the summed int(comparison)s
+    
+    # Confidence scaling (only increase for very high confidence)
+    # 0.8x below 0.8 confidence, up to 1.1x at 100% confidence
+    confidence_mult = (0.8, 1 + ((confidence - 0.8) * 0.5))[int(confidence > 0.8)]
+    
+    # Daily profit protection (reduce size as we approach daily target)
+    # 0.7x from 60% of target, cut in half from 80%
+    daily_mult = (1.0, 0.7, 0.5)[int(daily_return >= daily_target * 0.6) + int(daily_return >= daily_target * 0.8)]
+    
+    # Winning streak scaling over the last 10 trades (gradually increase size with success)
+    # 1.0x with no trades yet, else 0.9x below 70% wins, 1.05x from 70%, 1.1x from 80%
+    recent_win_rate = recent_wins / max(recent_count, 1)
+    streak_mult = (1.0, 0.9, 1.05, 1.1)[int(recent_count > 0) * (1 + int(recent_win_rate >= 0.7) + int(recent_win_rate >= 0.8))]
+    
+    # Drawdown protection - size shrinks linearly with drawdown from peak, to zero at d_max
+    dd_mod = _m_factor(peak_distance, d_max)
+    
+    # Apply all conservative multipliers
+    final_size = base_size * confidence_mult * daily_mult * streak_mult * dd_mod
+    
+    # Ultra-conservative bounds
+    final_size = min(final_size, capital * 0.02)   # Max 2% per trade (reduced from risk_cap)
+    final_size = max(final_size, capital * 0.003)  # Minimum 0.3% per trade
+    
+    return final_size
+
+
+@njit(cache=True, fastmath=True)
+def _trade_core(position_size, confidence, trend_strength, support_resistance, regime_code,
+                stop_loss, rand_exec, rand_profit):
+    """Numeric core of ConservativeBot.trade - returns (is_win, pnl, pct)
+    
+    Random draws are passed in so the kernel stays deterministic and free of
+    any RNG state.
+    """
+    # Conservative success probability (high baseline) with small trend and S/R bonuses,
+    # scaled by the regime preference
+    base_success_prob = 0.65 + (confidence * 0.2)  # 65-85% range
+    trend_bonus = (trend_strength - 0.5) * 0.1
+    sr_bonus = (support_resistance - 0.5) * 0.1
+    success_prob = (base_success_prob + trend_bonus + sr_bonus) * CONSERVATIVE_SUCCESS[regime_code]
+    success_prob = _clip(success_prob, 0.60, 0.88)
+    
+    if rand_exec < success_prob:
+        base_profit_pct = 0.008 + 0.012 * rand_profit  # Small, consistent profits
+        confidence_bonus = 1 + ((confidence - 0.75) * 0.2)  # Small confidence bonus
+        profit_pct = min(0.02, base_profit_pct * confidence_bonus * CONSERVATIVE_PROFIT[regime_code])  # Cap at 2%
+        return True, position_size * profit_pct, profit_pct
+    
+    loss_pct = min(0.008, stop_loss * CONSERVATIVE_LOSS[regime_code])  # Very tight, cap at 0.8%
+    return False, -(position_size * loss_pct), loss_pct
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_conservative(capital, initial_capital, peak_capital, daily_profit, daily_trades,
+                           safety_violations, tradable, confidences, trend_strengths, srs,
+                           regime_codes, has_ai_size, ai_size, rand, recent, params):
+    """Per-tick trade loop behind ConservativeBot.simulate()
+    
+    `rand` holds two pre-drawn uniforms per tick (outcome, profit size) and
+    `recent` the 0/1 outcomes of up to the last 10 trades. Returns the final
+    (capital, peak_capital, daily_profit, daily_trades, safety_violations)
+    and a trade log with one (tick, is_win, size, pnl, pct, regime_code) row
+    per trade.
+    """
+    daily_target, max_drawdown, max_daily_trades, stop_loss, risk_cap, kelly_fraction, d_max = params
+    n = confidences.shape[0]
+    log = np.empty((n, 6), dtype=np.float64)
+    
+    # Ring buffer of the last 10 outcomes for the streak multiplier
+    ring = np.zeros(10, dtype=np.int64)
+    ring_count = 0
+    ring_pos = 0
+    recent_wins = 0
+    for j in range(recent.shape[0]):
+        ring[ring_pos] = recent[j]
+        recent_wins += recent[j]
+        ring_count += 1
+        ring_pos = (ring_pos + 1) % 10
+    
+    current_dd = (initial_capital - capital) / initial_capital
+    daily_return = daily_profit / capital if capital > 0 else 0.0
+    peak_distance = (peak_capital - capital) / peak_capital if peak_capital > 0 else 0.0
+    
+    k = 0
+    for i in range(n):
+        # Stops - once hit, nothing changes for the rest of the batch
+        if daily_trades >= max_daily_trades:
+            break
+        if daily_return >= daily_target:
+            break
+        if current_dd > max_drawdown:
+            break
+        
+        if not tradable[i]:
+            safety_violations += 1
+            continue
+        
+        regime = regime_codes[i]
+        confidence = confidences[i]
+        position_size = _position_size_core(capital, peak_distance, daily_return, daily_target,
+                                            kelly_fraction, d_max, risk_cap, has_ai_size[i],
+                                            ai_size[i], confidence, recent_wins, ring_count)
+        
+        win, pnl, pct = _trade_core(position_size, confidence, trend_strengths[i], srs[i], regime,
+                                    stop_loss, rand[i, 0], rand[i, 1])
+        is_win = int(win)
+        
+        capital += pnl
+        daily_profit += pnl
+        if capital > peak_capital:
+            peak_capital = capital
+        daily_trades += 1
+        current_dd = (initial_capital - capital) / initial_capital
+        daily_return = daily_profit / capital if capital > 0 else 0.0
+        peak_distance = (peak_capital - capital) / peak_capital if peak_capital > 0 else 0.0
+        
+        if ring_count == 10:
+            recent_wins -= ring[ring_pos]
+        else:
+            ring_count += 1
+        ring[ring_pos] = is_win
+        recent_wins += is_win
+        ring_pos = (ring_pos + 1) % 10
+        
+        log[k, 0] = i
+        log[k, 1] = is_win
+        log[k, 2] = position_size
+        log[k, 3] = pnl
+        log[k, 4] = pct
+        log[k, 5] = regime
+        k += 1
+    
+    return capital, peak_capital, daily_profit, daily_trades, safety_violations, log[:k]
+
+
+# Prefer the ahead-of-time build when present and current (python -m strategies._kernels)
+_simulate_kernel = load_aot('simulate_conservative', _simulate_conservative)
+
 
 class ConservativeBot:
     def __init__(self, capital, **kwargs):
@@ -10,6 +207,8 @@ class ConservativeBot:
         self.daily_target = kwargs.get('daily_target', 0.01)  # 1% daily target as requested
         self.risk_cap = kwargs.get('risk_cap', 0.015)  # Reduced to 1.5% max risk per trade
         self.max_drawdown = kwargs.get('max_drawdown', 0.03)  # Tightened to 3% max drawdown
+        self.d_max = kwargs.get('d_max', self.max_drawdown)  # Drawdown from peak at which size reaches zero
+        self.kelly_fraction = kwargs.get('kelly_fraction', 0.01)  # Base size as a fraction of capital
         self.stop_loss = kwargs.get('stop_loss', 0.005)  # Ultra-tight 0.5% stop loss
         
         # Ultra-conservative parameters
@@ -20,257 +219,327 @@ class ConservativeBot:
         
         # Ultra-tight risk controls
         self.emergency_stop_dd = 0.025  # Emergency stop at 2.5%
-        self.size_reduction_dd = 0.02   # Start reducing size at 2%
         
         # Safety mechanisms
         self.safety_first = kwargs.get('safety_first', True)
         self.preserve_capital = kwargs.get('preserve_capital', True)
         self.gradual_scaling = kwargs.get('gradual_scaling', True)
+        self.verbose = kwargs.get('verbose', True)  # False: trade() returns tuples, not messages
         
         # Performance tracking
         self.daily_trades = 0
         self.daily_profit = 0
-        self.trade_history = []
-        self.daily_history = []
         self.consecutive_profitable_days = 0
         self.total_profitable_days = 0
         self.peak_capital = capital
         self.safety_violations = 0
         
+        # Risk state read by position sizing, refreshed whenever capital changes
+        self._dd = 0.0
+        self._daily_return = 0.0
+        self._peak_dist = 0.0
+        
+        # Columnar trade history (see the trade_history property)
+        self._h_size = array('d')
+        self._h_pnl = array('d')     # Signed: profit on wins, -loss on losses
+        self._h_pct = array('d')
+        self._h_conf = array('d')
+        self._h_regime = array('b')
+        self._h_win = array('b')
+        self._h_ts = array('q')      # time.time_ns()
+        
+        # Columnar daily history (see the daily_history property)
+        self._d_date = array('l')    # Days since the epoch (UTC)
+        self._d_return = array('d')
+        self._d_profit = array('d')
+        self._d_trades = array('l')
+        self._d_target = array('b')
+        self._d_violations = array('l')
+        
+        # Rolling 0/1 outcomes of the last 10 trades and their sum, for streak sizing
+        self._recent = deque(maxlen=10)
+        self._recent_sum = 0
+        
+        # Running aggregates so get_status() never rescans the history
+        self._wins = 0
+        self._sum_daily_returns = 0.0
+        self._target_days = 0
+        
+        # Per-bot RNGs (seed kwarg for reproducible runs): trade() and the vectorized simulate()
+        self._rng = random.Random(kwargs.get('seed'))
+        self._nprng = np.random.default_rng(kwargs.get('seed')) if np is not None else None
+        
+    @property
+    def trade_history(self):
+        """Trade log as a list of dicts, rebuilt on demand from the columnar store"""
+        history = []
+        for i in range(len(self._h_win)):
+            record = {
+                'timestamp': iso_ns(self._h_ts[i]),
+                'type': 'WIN' if self._h_win[i] else 'LOSS',
+                'size': self._h_size[i]
+            }
+            if self._h_win[i]:
+                record['profit'] = self._h_pnl[i]
+                record['profit_pct'] = self._h_pct[i]
+            else:
+                record['loss'] = -self._h_pnl[i]
+                record['loss_pct'] = self._h_pct[i]
+            record['confidence'] = self._h_conf[i]
+            record['regime'] = REGIME_BY_CODE[self._h_regime[i]]
+            history.append(record)
+        return history
+    
+    @property
+    def daily_history(self):
+        """Daily summaries as a list of dicts, rebuilt on demand from the columnar store"""
+        return [{
+            'date': time.strftime('%Y-%m-%d', time.gmtime(self._d_date[i] * 86400)),
+            'return': self._d_return[i],
+            'profit': self._d_profit[i],
+            'trades': self._d_trades[i],
+            'target_achieved': bool(self._d_target[i]),
+            'safety_violations': self._d_violations[i]
+        } for i in range(len(self._d_return))]
+    
+    def _update_risk_state(self):
+        """Refresh the cached drawdown, daily return and peak distance"""
+        self._dd = (self.initial_capital - self.capital) / self.initial_capital if self.initial_capital > 0 else 0.0
+        self._daily_return = self.daily_profit / self.capital if self.capital > 0 else 0.0
+        self._peak_dist = (self.peak_capital - self.capital) / self.peak_capital if self.peak_capital > 0 else 0.0
+    
+    def _record_trade(self, is_win, size, pnl, pct, confidence, regime_code):
+        """Append one trade to the columnar history"""
+        self._h_size.append(size)
+        self._h_pnl.append(pnl)
+        self._h_pct.append(pct)
+        self._h_conf.append(confidence)
+        self._h_regime.append(regime_code)
+        self._h_win.append(is_win)
+        self._h_ts.append(time.time_ns())
+        self._wins += 1 if is_win else 0
+        
+        evicted = self._recent[0] if len(self._recent) == 10 else 0
+        self._recent.append(1 if is_win else 0)
+        self._recent_sum += (1 if is_win else 0) - evicted
+    
+    @staticmethod
+    def _unpack(metrics):
+        """Read every field the trading path needs from a metrics dict, once"""
+        get = metrics.get
+        return Metrics(get('spread', 0.001), get('volume', 1000000), get('volatility', 0.1),
+                       get('ai_confidence', 0.5), REGIME_CODES.get(get('regime', 'unknown'), REGIME_UNKNOWN),
+                       get('support_resistance', 0.5), get('trend_strength', 0.5), get('confluence', 0.5),
+                       get('rsi', 50), get('volume_profile', 1.0), get('position_size'))
+    
+    @classmethod
+    def _as_metrics(cls, metrics):
+        """Metrics from a metrics dict, or a caller-built Metrics with its regime resolved to a code
+        
+        Regime names, Regime members and out-of-range codes in a ready-made
+        tuple are mapped like _unpack maps them, so the tables only ever see
+        codes 0-5.
+        """
+        if not isinstance(metrics, Metrics):
+            return cls._unpack(metrics)
+        code = REGIME_CODES.get(metrics.regime, REGIME_UNKNOWN)
+        return metrics if code is metrics.regime else metrics._replace(regime=code)
+    
     def can_trade(self, metrics):
-        """Ultra-strict trading conditions"""
-        # Basic market health checks
-        spread = metrics.get('spread', 0.001)
-        volume = metrics.get('volume', 1000000)
-        volatility = metrics.get('volatility', 0.1)
-        ai_confidence = metrics.get('ai_confidence', 0.5)
-        regime = metrics.get('regime', 'unknown')
-        
-        # Conservative requirements
-        spread_ok = spread < 0.002           # Tight spreads only
-        volume_ok = volume > 1000000         # High volume only
-        vol_ok = 0.01 < volatility < 0.08    # Low to moderate volatility
-        confidence_ok = ai_confidence >= self.min_confidence  # High confidence only
-        
-        # Regime preferences (ultra-conservative)
-        regime_ok = regime in ['trending_bull', 'low_volatility', 'sideways']
-        if regime == 'high_volatility':
-            return False  # Never trade in high volatility
-        
-        # Additional safety checks
-        support_resistance = metrics.get('support_resistance', 0.5)
-        trend_strength = metrics.get('trend_strength', 0.5)
-        confluence = metrics.get('confluence', 0.5)
-        
-        sr_ok = support_resistance > 0.7     # Strong S/R levels
-        trend_ok = trend_strength > 0.6      # Strong trend
-        confluence_ok = confluence > 0.75    # High confluence
-        
-        # Market timing (avoid risky periods)
-        rsi = metrics.get('rsi', 50)
-        rsi_ok = 35 < rsi < 65  # Avoid extreme RSI
-        
-        # Volume profile check
-        volume_profile = metrics.get('volume_profile', 1.0)
-        volume_profile_ok = volume_profile > 0.8
-        
-        return all([spread_ok, volume_ok, vol_ok, confidence_ok, regime_ok,
-                   sr_ok, trend_ok, confluence_ok, rsi_ok, volume_profile_ok])
+        """Ultra-strict trading conditions
+        
+        Accepts a metrics dict or an unpacked Metrics. Short-circuits on the
+        first failed check.
+        """
+        m = self._as_metrics(metrics)
+        return self._can_trade(m, self.min_confidence)
+    
+    @staticmethod
+    def _can_trade(m, min_confidence):
+        """can_trade over unpacked Metrics - touches no bot state"""
+        return (
+            # Basic market health checks
+            m.spread < 0.002 and                        # Tight spreads only
+            m.volume > 1000000 and                      # High volume only
+            0.01 < m.volatility < 0.08 and              # Low to moderate volatility
+            m.ai_confidence >= min_confidence and       # High confidence only
+            # Regime preferences (ultra-conservative) - never trade in high volatility
+            CONSERVATIVE_OK[m.regime] and
+            # Additional safety checks
+            m.support_resistance > 0.7 and              # Strong S/R levels
+            m.trend_strength > 0.6 and                  # Strong trend
+            m.confluence > 0.75 and                     # High confluence
+            35 < m.rsi < 65 and                         # Market timing - avoid extreme RSI
+            m.volume_profile > 0.8                      # Volume profile check
+        )
+    
+    def can_trade_batch(self, metrics, n):
+        """Vectorized can_trade over n ticks - returns a boolean mask"""
+        def column(key, default):
+            return np.broadcast_to(np.asarray(metrics[key] if key in metrics else default), (n,))
+        
+        volatility = column('volatility', 0.1)
+        rsi = column('rsi', 50)
+        regime_code = encode_regimes(metrics['regime'] if 'regime' in metrics else 'unknown', n)
+        
+        return ((column('spread', 0.001) < 0.002) &
+                (column('volume', 1000000) > 1000000) &
+                (0.01 < volatility) & (volatility < 0.08) &
+                (column('ai_confidence', 0.5) >= self.min_confidence) &
+                np.array(CONSERVATIVE_OK)[regime_code] &
+                (column('support_resistance', 0.5) > 0.7) &
+                (column('trend_strength', 0.5) > 0.6) &
+                (column('confluence', 0.5) > 0.75) &
+                (35 < rsi) & (rsi < 65) &
+                (column('volume_profile', 1.0) > 0.8))
     
     def calculate_position_size(self, metrics):
         """Ultra-conservative position sizing"""
-        # Start with minimal base size
-        base_size = self.capital * 0.01  # 1% base
-        
-        # AI sizing (but capped conservatively)
-        if 'position_size' in metrics:
-            ai_size = metrics['position_size'] * self.capital
-            # Take smaller of AI suggestion and conservative limit
-            base_size = min(base_size, ai_size, self.capital * self.risk_cap)
-        
-        # Confidence scaling (only increase for very high confidence)
-        confidence = metrics.get('ai_confidence', 0.5)
-        if confidence > 0.8:
-            confidence_mult = 1 + ((confidence - 0.8) * 0.5)  # Max 1.1x for 100% confidence
-        else:
-            confidence_mult = 0.8  # Reduce size for lower confidence
-        
-        # Drawdown protection (reduce size as drawdown increases)
-        current_dd = (self.initial_capital - self.capital) / self.initial_capital
-        dd_protection = max(0.3, 1 - (current_dd * 5))  # Aggressive reduction
-        
-        # Daily profit protection (reduce size as we approach daily target)
-        daily_return = self.daily_profit / self.capital if self.capital > 0 else 0
-        if daily_return >= self.daily_target * 0.8:  # 80% of target reached
-            daily_mult = 0.5  # Cut size in half
-        elif daily_return >= self.daily_target * 0.6:  # 60% of target
-            daily_mult = 0.7
-        else:
-            daily_mult = 1.0
-        
-        # Peak distance protection
-        peak_distance = (self.peak_capital - self.capital) / self.peak_capital if self.peak_capital > 0 else 0
-        peak_mult = max(0.4, 1 - (peak_distance * 2))
-        
-        # Winning streak scaling (gradually increase size with success)
-        recent_trades = self.trade_history[-10:] if len(self.trade_history) >= 10 else self.trade_history
-        if recent_trades:
-            recent_wins = len([t for t in recent_trades if t['type'] == 'WIN'])
-            recent_win_rate = recent_wins / len(recent_trades)
-            
-            if recent_win_rate >= 0.8:  # 80%+ win rate
-                streak_mult = 1.1
-            elif recent_win_rate >= 0.7:  # 70%+ win rate
-                streak_mult = 1.05
-            else:
-                streak_mult = 0.9  # Reduce if win rate drops
-        else:
-            streak_mult = 1.0
-        
-        # Size reduction for approaching ultra-tight drawdown limit
-        if current_dd > self.size_reduction_dd:
-            size_reduction_factor = 0.4  # Cut size by 60%
-        else:
-            size_reduction_factor = 1.0
-        
-        # Apply all conservative multipliers with size reduction
-        final_size = (base_size * confidence_mult * dd_protection * 
-                     daily_mult * peak_mult * streak_mult * size_reduction_factor)
-        
-        # Ultra-conservative bounds
-        final_size = min(final_size, self.capital * 0.02)   # Max 2% per trade (reduced from risk_cap)
-        final_size = max(final_size, self.capital * 0.003)  # Minimum 0.3% per trade
-        
-        return final_size
+        m = self._as_metrics(metrics)
+        return self._position_size(m.ai_confidence, m.position_size)
+    
+    def _position_size(self, confidence, ai_suggestion):
+        """Position size from the AI confidence and optional AI size suggestion"""
+        return _position_size_core(float(self.capital), self._peak_dist, self._daily_return,
+                                   self.daily_target, self.kelly_fraction, self.d_max, self.risk_cap,
+                                   ai_suggestion is not None,
+                                   float(ai_suggestion) if ai_suggestion is not None else 0.0,
+                                   float(confidence), self._recent_sum, len(self._recent))
     
     def trade(self, metrics):
-        """Execute ultra-conservative trade"""
+        """Execute ultra-conservative trade from a metrics dict (or Metrics)"""
+        return self.trade_with(metrics)
+    
+    def trade_with(self, m):
+        """Execute ultra-conservative trade from unpacked Metrics (or a metrics dict)"""
+        m = self._as_metrics(m)
         if self.daily_trades >= self.max_daily_trades:
             return "⏸️ Conservative daily limit reached"
         
         # Daily target check
-        daily_return = self.daily_profit / self.capital if self.capital > 0 else 0
-        if daily_return >= self.daily_target:
-            return f"✅ Conservative target achieved: {daily_return:.2%}"
+        if self._daily_return >= self.daily_target:
+            return f"✅ Conservative target achieved: {self._daily_return:.2%}"
         
         # Drawdown protection with ultra-tight limits
-        current_dd = (self.initial_capital - self.capital) / self.initial_capital
-        if current_dd > self.max_drawdown:
-            return f"🛡️ Conservative drawdown limit: {current_dd:.2%} (Max: {self.max_drawdown:.1%})"
+        if self._dd > self.max_drawdown:
+            return f"🛡️ Conservative drawdown limit: {self._dd:.2%} (Max: {self.max_drawdown:.1%})"
         
         # Market safety check
-        if not self.can_trade(metrics):
+        if not self._can_trade(m, self.min_confidence):
             self.safety_violations += 1
             return "🟡 No trade — Conservative safety filters active"
         
         # Position sizing
-        position_size = self.calculate_position_size(metrics)
+        position_size = self._position_size(m.ai_confidence, m.position_size)
         
         # Ultra-conservative execution
-        confidence = metrics.get('ai_confidence', 0.5)
-        trend_strength = metrics.get('trend_strength', 0.5)
-        support_resistance = metrics.get('support_resistance', 0.5)
-        regime = metrics.get('regime', 'unknown')
-        
-        # Conservative success probability (high baseline)
-        base_success_prob = 0.65 + (confidence * 0.2)  # 65-85% range
-        
-        # Additional conservative bonuses
-        trend_bonus = (trend_strength - 0.5) * 0.1  # Small trend bonus
-        sr_bonus = (support_resistance - 0.5) * 0.1  # Small S/R bonus
-        
-        # Regime adjustments (conservative preferences)
-        regime_adj = {
-            'trending_bull': 1.1,
-            'low_volatility': 1.15,  # Love low volatility
-            'sideways': 1.0,
-            'trending_bear': 0.95,
-            'high_volatility': 0.0   # Never trade (filtered out earlier)
-        }.get(regime, 0.9)
-        
-        final_success_prob = (base_success_prob + trend_bonus + sr_bonus) * regime_adj
-        final_success_prob = min(0.88, max(0.60, final_success_prob))  # Conservative bounds
-        
-        # Execute trade
-        if random.random() < final_success_prob:
+        confidence = m.ai_confidence
+        regime_code = m.regime
+        
+        is_win, pnl, pct = _trade_core(position_size, float(confidence), float(m.trend_strength),
+                                       float(m.support_resistance), regime_code, self.stop_loss,
+                                       self._rng.random(), self._rng.random())
+        
+        self.capital += pnl
+        self.daily_profit += pnl
+        
+        # Update peak
+        if self.capital > self.peak_capital:
+            self.peak_capital = self.capital
+        
+        self.daily_trades += 1
+        self._update_risk_state()
+        
+        # Log trade
+        self._record_trade(is_win, position_size, pnl, pct, confidence, regime_code)
+        
+        if is_win:
             # WINNING TRADE - Conservative profit
-            base_profit_pct = random.uniform(0.008, 0.020)  # Small, consistent profits
-            
-            # Conservative bonuses (smaller than other strategies)
-            confidence_bonus = 1 + ((confidence - 0.75) * 0.2)  # Small confidence bonus
-            
-            # Regime profit adjustment
-            regime_profit_adj = {
-                'trending_bull': 1.15,
-                'low_volatility': 1.1,
-                'sideways': 1.0,
-                'trending_bear': 1.05
-            }.get(regime, 1.0)
-            
-            final_profit_pct = base_profit_pct * confidence_bonus * regime_profit_adj
-            final_profit_pct = min(0.02, final_profit_pct)  # Reduced cap to 2%
-            
-            profit = position_size * final_profit_pct
-            self.capital += profit
-            self.daily_profit += profit
-            
-            # Update peak
-            if self.capital > self.peak_capital:
-                self.peak_capital = self.capital
-            
-            self.daily_trades += 1
-            
-            # Log trade
-            trade_record = {
-                'timestamp': datetime.utcnow().isoformat(),
-                'type': 'WIN',
-                'size': position_size,
-                'profit': profit,
-                'profit_pct': final_profit_pct,
-                'confidence': confidence,
-                'regime': regime
-            }
-            self.trade_history.append(trade_record)
-            
-            return f"💼 Conservative WIN | +${profit:.2f} ({final_profit_pct:.2%}) | Capital: ${self.capital:.2f} | Daily: {(self.daily_profit/self.capital):.2%} | Target: {self.daily_target:.1%}"
-            
-        else:
-            # LOSING TRADE - Minimal loss
-            base_loss_pct = self.stop_loss
-            
-            # Regime loss adjustment (very tight)
-            regime_loss_adj = {
-                'trending_bull': 0.8,
-                'low_volatility': 0.7,  # Tightest stops in low vol
-                'sideways': 1.0,
-                'trending_bear': 0.9
-            }.get(regime, 1.0)
-            
-            adjusted_loss_pct = base_loss_pct * regime_loss_adj
-            adjusted_loss_pct = min(0.008, adjusted_loss_pct)  # Reduced cap to 0.8%
-            
-            loss = position_size * adjusted_loss_pct
-            self.capital -= loss
-            self.daily_profit -= loss
-            self.daily_trades += 1
-            
-            # Log trade
-            trade_record = {
-                'timestamp': datetime.utcnow().isoformat(),
-                'type': 'LOSS',
-                'size': position_size,
-                'loss': loss,
-                'loss_pct': adjusted_loss_pct,
-                'confidence': confidence,
-                'regime': regime
-            }
-            self.trade_history.append(trade_record)
-            
-            return f"🔻 Conservative LOSS | -${loss:.2f} ({adjusted_loss_pct:.2%}) | Capital: ${self.capital:.2f} | Daily: {(self.daily_profit/self.capital):.2%}"
+            if not self.verbose:
+                return ('WIN', pnl, pct)
+            return self._fmt_win(pnl, pct)
+        
+        # LOSING TRADE - Minimal loss
+        if not self.verbose:
+            return ('LOSS', -pnl, pct)
+        return self._fmt_loss(-pnl, pct)
+    
+    def _fmt_win(self, profit, pct):
+        """Display message for a winning trade"""
+        return f"💼 Conservative WIN | +${profit:.2f} ({pct:.2%}) | Capital: ${self.capital:.2f} | Daily: {(self.daily_profit/self.capital):.2%} | Target: {self.daily_target:.1%}"
+    
+    def _fmt_loss(self, loss, pct):
+        """Display message for a losing trade"""
+        return f"🔻 Conservative LOSS | -${loss:.2f} ({pct:.2%}) | Capital: ${self.capital:.2f} | Daily: {(self.daily_profit/self.capital):.2%}"
+    
+    def simulate(self, metrics, steps=None):
+        """Vectorized Monte Carlo run over a batch of ticks - returns per-tick PnL
+        
+        `metrics` is a DataFrame or dict of can_trade-style columns; scalar
+        values are broadcast to `steps` ticks. Behaves like calling trade()
+        once per tick: the daily trade limit, daily target and drawdown stops
+        all apply. Uniforms are drawn in bulk and the per-tick loop runs in
+        the compiled _simulate_conservative kernel.
+        """
+        if np is None:
+            raise ImportError("simulate requires numpy")
+        
+        if steps is None:
+            # Length of the first array column - scalars are broadcast to it
+            lengths = [len(col) for col in (np.asarray(metrics[key]) for key in metrics) if col.ndim]
+            if not lengths:
+                raise ValueError("steps is required when every column of `metrics` is a scalar")
+            steps = lengths[0]
+        n = steps
+        
+        def column(key, default):
+            return np.broadcast_to(np.asarray(metrics[key] if key in metrics else default, dtype=np.float64), (n,))
+        
+        tradable = self.can_trade_batch(metrics, n)
+        confidence = column('ai_confidence', 0.5)
+        regime_code = encode_regimes(metrics['regime'] if 'regime' in metrics else 'unknown', n)
+        has_ai_size = np.full(n, 'position_size' in metrics)
+        ai_size = column('position_size', 0.0)
+        
+        # Pre-draw (outcome, profit size) uniforms so runs are reproducible from the seed
+        rand = self._nprng.random((n, 2))
+        recent = np.array(self._recent, dtype=np.int64)
+        params = (float(self.daily_target), float(self.max_drawdown), int(self.max_daily_trades),
+                  float(self.stop_loss), float(self.risk_cap), float(self.kelly_fraction), float(self.d_max))
+        
+        (capital, peak_capital, daily_profit, daily_trades, safety_violations, log) = _simulate_kernel(
+            float(self.capital), float(self.initial_capital), float(self.peak_capital),
+            float(self.daily_profit), int(self.daily_trades), int(self.safety_violations), tradable,
+            confidence, column('trend_strength', 0.5),
+            column('support_resistance', 0.5), regime_code, has_ai_size, ai_size, rand, recent, params)
+        
+        self.capital = float(capital)
+        self.peak_capital = float(peak_capital)
+        self.daily_profit = float(daily_profit)
+        self.daily_trades = int(daily_trades)
+        self.safety_violations = int(safety_violations)
+        self._update_risk_state()
+        
+        # Bulk-append the trades to the columnar history
+        ticks = log[:, 0].astype(np.int64)
+        self._h_size.extend(log[:, 2].tolist())
+        self._h_pnl.extend(log[:, 3].tolist())
+        self._h_pct.extend(log[:, 4].tolist())
+        self._h_conf.extend(confidence[ticks].tolist())
+        self._h_regime.extend(log[:, 5].astype(np.int8).tolist())
+        self._h_win.extend(log[:, 1].astype(np.int8).tolist())
+        self._h_ts.extend([time.time_ns()] * len(log))
+        self._recent.extend(log[-10:, 1].astype(np.int64).tolist())
+        self._recent_sum = sum(self._recent)
+        self._wins += int(log[:, 1].sum())
+        
+        pnl = np.zeros(n)
+        pnl[ticks] = log[:, 3]
+        return pnl
     
     def end_of_day_summary(self):
         """End of day processing for conservative strategy"""
-        daily_return = self.daily_profit / self.capital if self.capital > 0 else 0
+        daily_return = self._daily_return
         
         # Track profitable days
         if self.daily_profit > 0:
@@ -281,7 +550,7 @@ class ConservativeBot:
         
         # Save daily history
         daily_summary = {
-            'date': datetime.utcnow().strftime('%Y-%m-%d'),
+            'date': time.strftime('%Y-%m-%d', time.gmtime()),
             'return': daily_return,
             'profit': self.daily_profit,
             'trades': self.daily_trades,
@@ -289,34 +558,106 @@ class ConservativeBot:
             'safety_violations': self.safety_violations
         }
         
-        self.daily_history.append(daily_summary)
+        self._d_date.append(int(time.time() // 86400))
+        self._d_return.append(daily_return)
+        self._d_profit.append(self.daily_profit)
+        self._d_trades.append(self.daily_trades)
+        self._d_target.append(int(daily_summary['target_achieved']))
+        self._d_violations.append(self.safety_violations)
+        self._sum_daily_returns += daily_return
+        self._target_days += 1 if daily_summary['target_achieved'] else 0
         
-        # Reset daily counters
+        self._reset_daily_counters()
+        return daily_summary
+    
+    def _reset_daily_counters(self):
+        """Start a new trading day"""
         self.daily_profit = 0
         self.daily_trades = 0
         self.safety_violations = 0
+        self._daily_return = 0.0
+    
+    def simulate_days(self, metrics, n_days, steps_per_day=None):
+        """Run simulate() over n_days consecutive trading days - returns per-day profit
+        
+        Columns of `metrics` are split into n_days equal slices (scalars are
+        broadcast to `steps_per_day` ticks); a ValueError is raised when the
+        columns don't divide evenly into days. Equivalent to calling simulate()
+        then end_of_day_summary() once per day, but the end-of-day bookkeeping
+        is aggregated in one vectorized pass at the end.
+        """
+        if np is None:
+            raise ImportError("simulate_days requires numpy")
+        
+        if n_days < 1:
+            raise ValueError(f"n_days must be at least 1, got {n_days}")
+        
+        columns = {key: np.asarray(metrics[key]) for key in metrics}
+        lengths = {len(col) for col in columns.values() if col.ndim}
+        if steps_per_day is None:
+            if not lengths:
+                raise ValueError("steps_per_day is required when every metric is a scalar")
+            steps_per_day = max(lengths) // n_days
+        if lengths - {n_days * steps_per_day}:
+            raise ValueError(f"metric columns must hold n_days * steps_per_day = {n_days * steps_per_day} ticks, "
+                             f"got lengths {sorted(lengths)}")
+        
+        profits = np.empty(n_days)
+        returns = np.empty(n_days)
+        trades = np.empty(n_days, dtype=np.int64)
+        violations = np.empty(n_days, dtype=np.int64)
+        for day in range(n_days):
+            start = day * steps_per_day
+            self.simulate({key: col[start:start + steps_per_day] if col.ndim else col
+                           for key, col in columns.items()}, steps_per_day)
+            profits[day] = self.daily_profit
+            returns[day] = self._daily_return
+            trades[day] = self.daily_trades
+            violations[day] = self.safety_violations
+            self._reset_daily_counters()
+        
+        # Profitable-day streak: days since the last losing day (run-length reset),
+        # continuing the streak carried in when there is no losing day in the batch
+        profitable = profits > 0
+        day_idx = np.arange(1, n_days + 1)
+        last_reset = np.maximum.accumulate(np.where(profitable, 0, day_idx))
+        if n_days:
+            streak = day_idx[-1] - last_reset[-1]
+            self.consecutive_profitable_days = int(streak if last_reset[-1] else streak + self.consecutive_profitable_days)
+        self.total_profitable_days += int(np.count_nonzero(profitable))
         
-        return daily_summary
+        # Save daily history
+        target_achieved = returns >= self.daily_target
+        self._d_date.extend([int(time.time() // 86400)] * n_days)
+        self._d_return.extend(returns.tolist())
+        self._d_profit.extend(profits.tolist())
+        self._d_trades.extend(trades.tolist())
+        self._d_target.extend(target_achieved.astype(np.int8).tolist())
+        self._d_violations.extend(violations.tolist())
+        self._sum_daily_returns += float(returns.sum())
+        self._target_days += int(np.count_nonzero(target_achieved))
+        
+        return profits
     
     def get_status(self):
         """Comprehensive conservative strategy status"""
         current_dd = (self.initial_capital - self.capital) / self.initial_capital if self.initial_capital > 0 else 0
         total_return = (self.capital - self.initial_capital) / self.initial_capital if self.initial_capital > 0 else 0
-        daily_return = self.daily_profit / self.capital if self.capital > 0 else 0
+        daily_return = self._daily_return
         
         # Calculate win rate
-        wins = len([t for t in self.trade_history if t['type'] == 'WIN'])
-        win_rate = wins / len(self.trade_history) if self.trade_history else 0
+        total_trades = len(self._h_win)
+        win_rate = self._wins / total_trades if total_trades else 0
         
         # Calculate average daily return
-        avg_daily_return = sum(d['return'] for d in self.daily_history) / len(self.daily_history) if self.daily_history else 0
+        n_days = len(self._d_return)
+        avg_daily_return = self._sum_daily_returns / n_days if n_days else 0
         
         # Target achievement rate
-        target_days = len([d for d in self.daily_history if d['target_achieved']])
-        target_achievement_rate = target_days / len(self.daily_history) if self.daily_history else 0
+        target_achievement_rate = self._target_days / n_days if n_days else 0
         
         # Safety metrics
-        total_trading_days = len(self.daily_history) if self.daily_history else 1
+        total_trading_days = n_days if n_days else 1
         safety_score = 1 - (self.safety_violations / max(1, self.daily_trades + self.safety_violations))
         
         return {
@@ -330,7 +671,7 @@ class ConservativeBot:
             "drawdown": f"{current_dd:.2%}",
             "max_drawdown_limit": f"{self.max_drawdown:.1%}",
             "trades_today": self.daily_trades,
-            "total_trades": len(self.trade_history),
+            "total_trades": total_trades,
             "win_rate": f"{win_rate:.1%}",
             "target_win_rate": f"{self.min_win_rate_required:.1%}",
             "avg_daily_return": f"{avg_daily_return:.2%}",
@@ -342,5 +683,5 @@ class ConservativeBot:
             "risk_level": "ULTRA_CONSERVATIVE",
             "ai_enhanced": True,
             "preserve_capital_mode": self.preserve_capital,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": iso_ns(time.time_ns())
         }
@@ -1,7 +1,101 @@
 # flip_v2.py - AI-Enhanced Full Send Mode for 100% Daily Compounding
 import random
-import math
-from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the batch helpers
+    np = None
+
+from ._kernels import load_aot
+from ._njit import njit
+
+
+@njit(cache=True)
+def _position_size_core(capital, initial_capital, daily_target, max_daily_trades, daily_trades,
+                        max_position_size, confidence, current_streak, consecutive_losses):
+    """FLIP position sizing - shared by trade() and simulate()"""
+    # Calculate progress toward 100% daily target
+    current_return = (capital - initial_capital) / initial_capital
+    remaining_target = max(0.0, daily_target - current_return)
+    trades_left = max(1, max_daily_trades - daily_trades)
+    
+    # Size to hit remaining target
+    if remaining_target > 0:
+        target_per_trade = remaining_target / trades_left
+        base_size = capital * min(target_per_trade, max_position_size)
+    else:
+        base_size = capital * 0.05  # Reduce after target hit
+    
+    # Confidence scaling for FLIP mode
+    confidence_mult = 0.7 + (confidence * 0.6)  # 70%-130%
+    
+    # Hot streak bonus - 10% per win, capped at 1.5x (1.0x with no streak)
+    streak_mult = min(1.5, 1 + (current_streak * 0.1))
+    
+    # Cold streak protection from the second loss in a row (branchless step)
+    loss_mult = (1.0, max(0.5, 1 - (consecutive_losses * 0.15)))[int(consecutive_losses >= 2)]
+    
+    final_size = base_size * confidence_mult * streak_mult * loss_mult
+    
+    # FLIP bounds
+    final_size = min(final_size, capital * max_position_size)
+    final_size = max(final_size, capital * 0.02)
+    
+    return final_size
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_flip(capital, initial_capital, peak_capital, daily_trades, consecutive_losses,
+                   current_streak, best_streak, signal, confidences, rand, params):
+    """Per-tick trade loop behind FlipBotV2.simulate()
+    
+    `rand` holds two pre-drawn uniforms per tick (outcome, profit/loss size).
+    Returns the final (capital, peak_capital, daily_trades, consecutive_losses,
+    current_streak, best_streak) and the per-tick PnL.
+    """
+    daily_target, max_dd, max_daily_trades, max_position_size, stop_loss = params
+    n = confidences.shape[0]
+    pnl = np.zeros(n)
+    
+    for i in range(n):
+        if daily_trades >= max_daily_trades:
+            break
+        current_return = (capital - initial_capital) / initial_capital
+        if current_return >= daily_target:
+            break
+        if -current_return > max_dd:
+            break
+        if not signal[i]:
+            continue
+        
+        confidence = confidences[i]
+        trade_size = _position_size_core(capital, initial_capital, daily_target, max_daily_trades,
+                                         daily_trades, max_position_size, confidence,
+                                         current_streak, consecutive_losses)
+        
+        # FLIP execution - 55-80% success rate
+        if rand[i, 0] < 0.55 + (confidence * 0.25):
+            trade_pnl = trade_size * min(0.35, (0.08 + 0.17 * rand[i, 1]) * (1 + confidence * 0.5))
+            consecutive_losses = 0
+            current_streak += 1
+            best_streak = max(best_streak, current_streak)
+        else:
+            trade_pnl = -(trade_size * min(0.04, stop_loss * (0.8 + 0.4 * rand[i, 1])))
+            consecutive_losses += 1
+            current_streak = 0
+        
+        capital += trade_pnl
+        if capital > peak_capital:
+            peak_capital = capital
+        daily_trades += 1
+        pnl[i] = trade_pnl
+    
+    return capital, peak_capital, daily_trades, consecutive_losses, current_streak, best_streak, pnl
+
+
+# Prefer the ahead-of-time build when present and current (python -m strategies._kernels)
+_simulate_kernel = load_aot('simulate_flip', _simulate_flip)
+
 
 class FlipBotV2:
     def __init__(self, capital, risk_mode="full_send", **kwargs):
@@ -15,6 +109,7 @@ class FlipBotV2:
         self.max_daily_trades = kwargs.get("max_daily_trades", 15)
         self.max_position_size = 0.35  # 35% per trade for flip power
         self.stop_loss = 0.02
+        self.verbose = kwargs.get("verbose", True)  # False: trade() returns tuples, not messages
         
         # Performance tracking
         self.trade_history = []
@@ -22,6 +117,10 @@ class FlipBotV2:
         self.current_streak = 0
         self.best_streak = 0
         
+        # Per-bot RNGs (seed kwarg for reproducible runs): trade() and the vectorized simulate()
+        self._rng = random.Random(kwargs.get("seed"))
+        self._nprng = np.random.default_rng(kwargs.get("seed")) if np is not None else None
+        
     def check_signal(self, market_data):
         vol = market_data.get("volatility", 0)
         breakout = market_data.get("breakout_score", 0)
@@ -36,44 +135,24 @@ class FlipBotV2:
         
         return vol_ok and breakout_ok and confidence_ok and momentum_ok
     
-    def calculate_position_size(self, market_data):
-        confidence = market_data.get("ai_confidence", 0.5)
-        
-        # Calculate progress toward 100% daily target
-        current_return = (self.capital - self.initial_capital) / self.initial_capital
-        remaining_target = max(0, self.daily_target - current_return)
-        trades_left = max(1, self.max_daily_trades - self.daily_trades)
-        
-        # Size to hit remaining target
-        if remaining_target > 0:
-            target_per_trade = remaining_target / trades_left
-            base_size = self.capital * min(target_per_trade, self.max_position_size)
-        else:
-            base_size = self.capital * 0.05  # Reduce after target hit
-        
-        # Confidence scaling for FLIP mode
-        confidence_mult = 0.7 + (confidence * 0.6)  # 70%-130%
-        
-        # Hot streak bonus
-        if self.current_streak > 0:
-            streak_mult = 1 + (self.current_streak * 0.1)  # 10% per win
-            streak_mult = min(1.5, streak_mult)
-        else:
-            streak_mult = 1.0
-        
-        # Cold streak protection
-        if self.consecutive_losses >= 2:
-            loss_mult = max(0.5, 1 - (self.consecutive_losses * 0.15))
-        else:
-            loss_mult = 1.0
-        
-        final_size = base_size * confidence_mult * streak_mult * loss_mult
+    def check_signal_batch(self, market_data, n):
+        """Vectorized check_signal over n ticks - returns a boolean mask"""
+        def column(key, default):
+            return np.broadcast_to(np.asarray(market_data[key] if key in market_data else default), (n,))
         
-        # FLIP bounds
-        final_size = min(final_size, self.capital * self.max_position_size)
-        final_size = max(final_size, self.capital * 0.02)
-        
-        return final_size
+        vol = column("volatility", 0)
+        return ((0.03 < vol) & (vol < 0.25) &
+                (column("breakout_score", 0) > 0.75) &
+                (column("ai_confidence", 0.5) > 0.6) &
+                (np.abs(column("momentum", 0.5)) > 0.4))
+    
+    def calculate_position_size(self, market_data):
+        return self._position_size(market_data.get("ai_confidence", 0.5))
+    
+    def _position_size(self, confidence):
+        return _position_size_core(float(self.capital), float(self.initial_capital), self.daily_target,
+                                   self.max_daily_trades, self.daily_trades, self.max_position_size,
+                                   float(confidence), self.current_streak, self.consecutive_losses)
     
     def trade(self, market_data):
         if self.daily_trades >= self.max_daily_trades:
@@ -98,9 +177,9 @@ class FlipBotV2:
         # FLIP execution - higher success rate for aggressive moves
         success_prob = 0.55 + (confidence * 0.25)  # 55-80%
         
-        if random.random() < success_prob:
+        if self._rng.random() < success_prob:
             # WIN - Target big moves for compounding
-            profit_pct = random.uniform(0.08, 0.25) * (1 + confidence * 0.5)
+            profit_pct = self._rng.uniform(0.08, 0.25) * (1 + confidence * 0.5)
             profit_pct = min(0.35, profit_pct)  # Cap at 35%
             
             profit = trade_size * profit_pct
@@ -114,17 +193,13 @@ class FlipBotV2:
             
             self.daily_trades += 1
             
-            # Recalculate progress after updating capital
-            new_return = (self.capital - self.initial_capital) / self.initial_capital
-            progress = (new_return / self.daily_target) * 100
-            return (
-                f"🚀 FLIP WIN | +${profit:.2f} ({profit_pct:.1%}) | "
-                f"Capital: ${self.capital:.2f} | Progress: {progress:.0f}%"
-            )
+            if not self.verbose:
+                return ("WIN", profit, profit_pct)
+            return self._fmt_win(profit, profit_pct)
             
         else:
             # LOSS
-            loss_pct = self.stop_loss * random.uniform(0.8, 1.2)
+            loss_pct = self.stop_loss * self._rng.uniform(0.8, 1.2)
             loss_pct = min(0.04, loss_pct)
             
             loss = trade_size * loss_pct
@@ -134,13 +209,67 @@ class FlipBotV2:
             self.current_streak = 0
             self.daily_trades += 1
             
-            # Recalculate remaining progress after loss
-            new_return = (self.capital - self.initial_capital) / self.initial_capital
-            remaining = max(0, (self.daily_target - new_return) * 100)
-            return (
-                f"❌ FLIP LOSS | -${loss:.2f} | Capital: ${self.capital:.2f} "
-                f"| Need: {remaining:.0f}%"
-            )
+            if not self.verbose:
+                return ("LOSS", loss, loss_pct)
+            return self._fmt_loss(loss)
+    
+    def _fmt_win(self, profit, pct):
+        """Display message for a winning trade, with progress toward the target"""
+        new_return = (self.capital - self.initial_capital) / self.initial_capital
+        progress = (new_return / self.daily_target) * 100
+        return (
+            f"🚀 FLIP WIN | +${profit:.2f} ({pct:.1%}) | "
+            f"Capital: ${self.capital:.2f} | Progress: {progress:.0f}%"
+        )
+    
+    def _fmt_loss(self, loss):
+        """Display message for a losing trade, with the return still needed"""
+        new_return = (self.capital - self.initial_capital) / self.initial_capital
+        remaining = max(0, (self.daily_target - new_return) * 100)
+        return (
+            f"❌ FLIP LOSS | -${loss:.2f} | Capital: ${self.capital:.2f} "
+            f"| Need: {remaining:.0f}%"
+        )
+    
+    def simulate(self, market_data, steps=None):
+        """Vectorized Monte Carlo run over a batch of ticks - returns per-tick PnL
+        
+        `market_data` is a DataFrame or dict of check_signal-style columns;
+        scalar values are broadcast to `steps` ticks. Behaves like calling
+        trade() once per tick; uniforms are drawn in bulk and the per-tick loop
+        runs in the compiled _simulate_flip kernel.
+        """
+        if np is None:
+            raise ImportError("simulate requires numpy")
+        
+        if steps is None:
+            # Length of the first array column - scalars are broadcast to it
+            lengths = [len(col) for col in (np.asarray(market_data[key]) for key in market_data) if col.ndim]
+            if not lengths:
+                raise ValueError("steps is required when every column of `market_data` is a scalar")
+            steps = lengths[0]
+        n = steps
+        signal = self.check_signal_batch(market_data, n)
+        confidence = np.broadcast_to(np.asarray(market_data.get("ai_confidence", 0.5), dtype=np.float64), (n,))
+        
+        # Pre-draw (outcome, profit/loss size) uniforms so runs are reproducible from the seed
+        rand = self._nprng.random((n, 2))
+        params = (float(self.daily_target), float(self.max_dd), int(self.max_daily_trades),
+                  float(self.max_position_size), float(self.stop_loss))
+        
+        (capital, peak_capital, daily_trades, consecutive_losses,
+         current_streak, best_streak, pnl) = _simulate_kernel(
+            float(self.capital), float(self.initial_capital), float(self.peak_capital), int(self.daily_trades),
+            int(self.consecutive_losses), int(self.current_streak), int(self.best_streak), signal, confidence,
+            rand, params)
+        
+        self.capital = float(capital)
+        self.peak_capital = float(peak_capital)
+        self.daily_trades = int(daily_trades)
+        self.consecutive_losses = int(consecutive_losses)
+        self.current_streak = int(current_streak)
+        self.best_streak = int(best_streak)
+        return pnl
     
     def get_status(self):
         current_dd = (self.initial_capital - self.capital) / self.initial_capital if self.initial_capital > 0 else 0
@@ -0,0 +1,18 @@
+# _scripted.py - Helpers for running the per-tick paths on scripted random draws
+
+
+class ScriptedRandom:
+    """Stands in for a bot's random.Random, handing out pre-drawn uniforms in order"""
+    def __init__(self):
+        self.draws = []
+
+    def random(self):
+        return self.draws.pop(0)
+
+    def uniform(self, lo, hi):
+        return lo + (hi - lo) * self.draws.pop(0)
+
+
+def row(columns, i):
+    """Tick i of a dict of numpy columns, as a scalar-path dict"""
+    return {key: col[i].item() for key, col in columns.items()}
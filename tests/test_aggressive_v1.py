@@ -0,0 +1,85 @@
+# test_aggressive_v1.py - AggressiveBot batch paths against the per-bar trade() loop
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from strategies.aggressive_v1 import AggressiveBot, simulate_ensemble
+from _scripted import row
+
+REGIMES = ['trending_bull', 'trending_bear', 'high_volatility', 'sideways', 'low_volatility', 'unknown']
+
+
+class ScriptedBot(AggressiveBot):
+    """AggressiveBot whose trade() draws come from a pre-drawn list"""
+    def _rand(self):
+        return self.draws.pop(0)
+
+
+def make_bars(n, seed):
+    """Signal columns that pass the aggressive filters fairly often"""
+    rng = np.random.default_rng(seed)
+    return {
+        'momentum': rng.uniform(-1, 1, n),
+        'trend_strength': rng.uniform(0.4, 1, n),
+        'breakout_score': rng.uniform(0.5, 1, n),
+        'volatility': rng.uniform(0, 0.2, n),
+        'volume_spike': rng.random(n) < 0.5,
+        'ai_confidence': rng.uniform(0.5, 1, n),
+        'regime': rng.choice(REGIMES, n),
+        'rsi': rng.choice([10.0, 50.0, 90.0], n),
+        'confluence': rng.uniform(0.5, 1, n),
+        'volume_ratio': rng.uniform(0.5, 2, n),
+        'position_size': rng.uniform(0.05, 0.3, n)
+    }
+
+
+@pytest.mark.parametrize('max_drawdown', [0.9, 0.18])
+def test_backtest_matches_trade_loop(max_drawdown):
+    n, seed = 3000, 11
+    bars = make_bars(n, seed)
+    batch = AggressiveBot(1000.0, seed=seed, max_drawdown=max_drawdown)
+    pnl = batch.backtest(bars)
+
+    # backtest() draws two uniforms per bar that passes the filter and, like
+    # one continuous session, ignores the daily trade limit
+    n_signals = int(AggressiveBot.signal_ok_batch(bars).sum())
+    scalar = ScriptedBot(1000.0, max_drawdown=max_drawdown, max_daily_trades=10**9)
+    scalar.draws = np.random.default_rng(seed).random((n_signals, 2)).ravel().tolist()
+    expected = np.zeros(n)
+    for i in range(n):
+        before = scalar.capital
+        scalar.trade(row(bars, i))
+        expected[i] = scalar.capital - before
+
+    assert pnl == pytest.approx(expected)
+    assert batch.capital == pytest.approx(scalar.capital)
+    assert batch.peak_capital == pytest.approx(scalar.peak_capital)
+    for attr in ('consecutive_wins', 'consecutive_losses', 'max_consecutive_wins'):
+        assert getattr(batch, attr) == getattr(scalar, attr)
+    assert batch.hot_streak_multiplier == pytest.approx(scalar.hot_streak_multiplier)
+    assert len(batch.trade_history) == len(scalar.trade_history) > 0
+    for x, y in zip(batch.trade_history, scalar.trade_history):
+        for key in x:
+            if key != 'timestamp':
+                assert x[key] == (pytest.approx(y[key]) if isinstance(y[key], float) else y[key])
+
+    # The daily counters are left alone
+    assert batch.daily_trades == 0
+    assert batch.daily_pnl == 0
+
+
+def test_simulate_ensemble_matches_backtest():
+    bars = make_bars(2000, 4)
+    capitals = simulate_ensemble([1000.0], bars, seed=8)
+    bot = AggressiveBot(1000.0, seed=8)
+    bot.backtest(bars)
+    assert capitals[0] == pytest.approx(bot.capital)
+
+
+def test_signal_ok_batch_matches_signal_ok():
+    n = 3000
+    bars = make_bars(n, 2)
+    bot = AggressiveBot(1000.0)
+    mask = AggressiveBot.signal_ok_batch(bars)
+    assert mask.tolist() == [bool(bot.signal_ok(row(bars, i))) for i in range(n)]
+    assert mask.any()
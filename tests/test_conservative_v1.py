@@ -0,0 +1,107 @@
+# test_conservative_v1.py - ConservativeBot batch paths against the per-tick trade() loop
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from strategies.conservative_v1 import ConservativeBot
+from _scripted import ScriptedRandom, row
+
+REGIMES = ['trending_bull', 'trending_bear', 'high_volatility', 'sideways', 'low_volatility', 'unknown', 'weird']
+
+
+def make_metrics(n, seed):
+    """Metric columns that pass the conservative filters fairly often"""
+    rng = np.random.default_rng(seed)
+    return {
+        'spread': rng.uniform(0, 0.0025, n),
+        'volume': rng.uniform(9e5, 3e6, n),
+        'volatility': rng.uniform(0.005, 0.09, n),
+        'ai_confidence': rng.uniform(0.75, 1, n),
+        'regime': rng.choice(REGIMES, n),
+        'support_resistance': rng.uniform(0.6, 1, n),
+        'trend_strength': rng.uniform(0.55, 1, n),
+        'confluence': rng.uniform(0.7, 1, n),
+        'rsi': rng.uniform(30, 70, n),
+        'volume_profile': rng.uniform(0.7, 1.5, n),
+        'position_size': rng.uniform(0.005, 0.02, n)
+    }
+
+
+def assert_same_history(a, b):
+    ha, hb = a.trade_history, b.trade_history
+    assert len(ha) == len(hb)
+    for x, y in zip(ha, hb):
+        assert x.keys() == y.keys()
+        for key in x:
+            if key == 'timestamp':
+                continue
+            assert x[key] == (pytest.approx(y[key]) if isinstance(y[key], float) else y[key])
+
+
+def run_trade_loop(bot, columns, draws):
+    """trade() once per tick, fed the same two uniforms per tick as simulate() - returns per-tick PnL"""
+    bot._rng = ScriptedRandom()
+    pnl = np.zeros(len(draws))
+    for i in range(len(draws)):
+        bot._rng.draws = list(draws[i])
+        before = bot.capital
+        bot.trade(row(columns, i))
+        pnl[i] = bot.capital - before
+    return pnl
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},                                                   # stops at the 4-trade daily limit
+    {'max_daily_trades': 50, 'daily_target': 0.5},        # long enough to exercise streak sizing
+    {'max_daily_trades': 50, 'daily_target': 0.5, 'max_drawdown': 0.001}
+])
+def test_simulate_matches_trade_loop(kwargs):
+    n, seed = 300, 7
+    columns = make_metrics(n, seed)
+    batch = ConservativeBot(10000.0, seed=seed, **kwargs)
+    scalar = ConservativeBot(10000.0, **kwargs)
+
+    draws = np.random.default_rng(seed).random((n, 2))  # what simulate() draws from its seeded generator
+    pnl = batch.simulate(columns)
+    expected = run_trade_loop(scalar, columns, draws)
+
+    assert pnl == pytest.approx(expected)
+    assert batch.capital == pytest.approx(scalar.capital)
+    assert batch.peak_capital == pytest.approx(scalar.peak_capital)
+    assert batch.daily_trades == scalar.daily_trades > 0
+    assert batch.safety_violations == scalar.safety_violations
+    assert_same_history(batch, scalar)
+    if not kwargs:
+        assert batch.daily_trades == batch.max_daily_trades
+
+
+def test_simulate_days_matches_daily_loop():
+    n_days, steps = 20, 40
+    columns = make_metrics(n_days * steps, 3)
+    batch = ConservativeBot(10000.0, seed=3, max_daily_trades=10)
+    looped = ConservativeBot(10000.0, seed=3, max_daily_trades=10)
+    batch.consecutive_profitable_days = looped.consecutive_profitable_days = 2
+
+    profits = batch.simulate_days(columns, n_days)
+    expected = []
+    for day in range(n_days):
+        looped.simulate({key: col[day * steps:(day + 1) * steps] for key, col in columns.items()})
+        expected.append(looped.daily_profit)
+        looped.end_of_day_summary()
+
+    assert profits.tolist() == pytest.approx(expected)
+    assert batch.daily_history == looped.daily_history
+    assert batch.consecutive_profitable_days == looped.consecutive_profitable_days
+    assert batch.total_profitable_days == looped.total_profitable_days
+    status, expected_status = batch.get_status(), looped.get_status()
+    assert {k: v for k, v in status.items() if k != 'timestamp'} == \
+           {k: v for k, v in expected_status.items() if k != 'timestamp'}
+
+
+def test_can_trade_batch_matches_can_trade():
+    n = 500
+    columns = make_metrics(n, 11)
+    bot = ConservativeBot(10000.0)
+    mask = bot.can_trade_batch(columns, n)
+    assert mask.tolist() == [bool(bot.can_trade(row(columns, i))) for i in range(n)]
+    assert mask.any()
@@ -0,0 +1,58 @@
+# test_flip_v2.py - FlipBotV2 batch paths against the per-tick trade() loop
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from strategies.flip_v2 import FlipBotV2
+from _scripted import ScriptedRandom, row
+
+
+def make_market_data(n, seed):
+    rng = np.random.default_rng(seed)
+    return {
+        'volatility': rng.uniform(0, 0.3, n),
+        'breakout_score': rng.uniform(0.6, 1, n),
+        'ai_confidence': rng.uniform(0.4, 1, n),
+        'momentum': rng.uniform(-1, 1, n)
+    }
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},                                   # stops at the 15-trade daily limit
+    {'max_daily_trades': 1000},           # runs on to the target / drawdown stops
+    {'max_daily_trades': 1000, 'max_drawdown': 0.02}
+])
+def test_simulate_matches_trade_loop(kwargs):
+    n, seed = 400, 5
+    market_data = make_market_data(n, seed)
+    batch = FlipBotV2(1000.0, seed=seed, **kwargs)
+    scalar = FlipBotV2(1000.0, **kwargs)
+
+    draws = np.random.default_rng(seed).random((n, 2))  # what simulate() draws from its seeded generator
+    pnl = batch.simulate(market_data)
+
+    scalar._rng = ScriptedRandom()
+    expected = np.zeros(n)
+    for i in range(n):
+        scalar._rng.draws = list(draws[i])
+        before = scalar.capital
+        scalar.trade(row(market_data, i))
+        expected[i] = scalar.capital - before
+
+    assert pnl == pytest.approx(expected)
+    for attr in ('capital', 'peak_capital'):
+        assert getattr(batch, attr) == pytest.approx(getattr(scalar, attr))
+    for attr in ('daily_trades', 'consecutive_losses', 'current_streak', 'best_streak'):
+        assert getattr(batch, attr) == getattr(scalar, attr)
+    assert batch.daily_trades > 0
+    if not kwargs:
+        assert batch.daily_trades == batch.max_daily_trades
+
+
+def test_check_signal_batch_matches_check_signal():
+    n = 500
+    market_data = make_market_data(n, 9)
+    bot = FlipBotV2(1000.0)
+    mask = bot.check_signal_batch(market_data, n)
+    assert mask.tolist() == [bool(bot.check_signal(row(market_data, i))) for i in range(n)]
+    assert mask.any()
@@ -0,0 +1,35 @@
+# test_kernels.py - load_aot() only trusts an ahead-of-time build stamped with the current source
+import sys
+import types
+
+import pytest
+
+from strategies import _kernels
+
+
+def fake_aot(monkeypatch, stamp):
+    module = types.ModuleType('strategies._kernels_aot')
+    module.simulate_flip = object()
+    if stamp is not None:
+        module.source_hash = lambda: stamp
+    monkeypatch.setitem(sys.modules, 'strategies._kernels_aot', module)
+    return module
+
+
+def test_missing_build_falls_back(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'strategies._kernels_aot', None)  # import raises ImportError
+    fallback = object()
+    assert _kernels.load_aot('simulate_flip', fallback) is fallback
+
+
+def test_current_build_is_used(monkeypatch):
+    module = fake_aot(monkeypatch, _kernels.source_hash())
+    assert _kernels.load_aot('simulate_flip', object()) is module.simulate_flip
+
+
+@pytest.mark.parametrize('stamp', [None, 12345])
+def test_stale_build_falls_back_with_warning(monkeypatch, stamp):
+    fake_aot(monkeypatch, stamp)
+    fallback = object()
+    with pytest.warns(RuntimeWarning, match='rebuild'):
+        assert _kernels.load_aot('simulate_flip', fallback) is fallback
@@ -0,0 +1,57 @@
+# test_regime_boundary.py - Regime values in caller-built Metrics / Signal tuples and columns
+import pytest
+
+from strategies._regime_tables import REGIME_CODES, REGIME_UNKNOWN, encode_regimes
+from strategies.aggressive_v1 import AggressiveBot, Signal
+from strategies.conservative_v1 import ConservativeBot, Metrics, Regime
+
+
+def _metrics(regime):
+    return Metrics(0.001, 2e6, 0.03, 0.9, regime, 0.8, 0.7, 0.8, 50, 1.0, None)
+
+
+def _signal(regime):
+    return Signal(0.8, 0.8, 0.9, 0.08, True, 0.9, regime, 80, 0.8, 2.0, None)
+
+
+@pytest.mark.parametrize('regime', [Regime.LOW_VOLATILITY, 'low_volatility'])
+def test_conservative_metrics_regime_matches_code(regime):
+    expected = ConservativeBot(10000.0, seed=1, verbose=False).trade(_metrics(int(Regime.LOW_VOLATILITY)))
+    bot = ConservativeBot(10000.0, seed=1, verbose=False)
+    assert bot.trade(_metrics(regime)) == expected
+    assert bot.trade_history[-1]['regime'] == 'low_volatility'
+
+
+@pytest.mark.parametrize('regime', [7, -1])
+def test_conservative_metrics_out_of_range_regime_is_unknown(regime):
+    bot = ConservativeBot(10000.0, seed=1)
+    assert not bot.can_trade(_metrics(regime))
+    assert bot.calculate_position_size(_metrics(regime)) > 0
+
+
+@pytest.mark.parametrize('regime', [Regime.TRENDING_BULL, 'trending_bull'])
+def test_aggressive_signal_regime_matches_code(regime):
+    expected = AggressiveBot(10000.0, seed=1, verbose=False).trade_with(_signal(int(Regime.TRENDING_BULL)))
+    bot = AggressiveBot(10000.0, seed=1, verbose=False)
+    assert bot.trade_with(_signal(regime)) == expected
+    assert bot.trade_history[-1]['regime'] == 'trending_bull'
+
+
+@pytest.mark.parametrize('regime', [9, -1])
+def test_aggressive_signal_out_of_range_regime_is_unknown(regime):
+    bot = AggressiveBot(10000.0, seed=1, verbose=False)
+    bot.trade_with(_signal(regime))
+    assert bot.trade_history[-1]['regime'] == 'unknown'
+
+
+def test_encode_regimes_mixed_column():
+    pytest.importorskip('numpy')
+    codes = encode_regimes(['sideways', Regime.TRENDING_BULL, 'nope', 7])
+    assert codes.tolist() == [int(Regime.SIDEWAYS), int(Regime.TRENDING_BULL), REGIME_UNKNOWN, REGIME_UNKNOWN]
+
+
+def test_encode_regimes_float_codes_match_scalar_path():
+    np = pytest.importorskip('numpy')
+    column = np.array([3.0, 0.0, np.nan, 2.5, -1.0, 7.0])
+    expected = [REGIME_CODES.get(value, REGIME_UNKNOWN) for value in column.tolist()]
+    assert encode_regimes(column).tolist() == expected